@@ -1,14 +1,25 @@
 """Entry point for Gobbler MCP server."""
 
+import asyncio
 import sys
 
 from .server import mcp
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (pip install gobbler-mcp[fast])
+    uvloop = None
+
 
 def main() -> None:
     """Run the MCP server."""
     try:
-        mcp.run()
+        if uvloop is not None:
+            # Same as mcp.run(), on a uvloop event loop
+            with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+                runner.run(mcp.run_async())
+        else:
+            mcp.run()
     except KeyboardInterrupt:
         print("\nShutting down...", file=sys.stderr)
         sys.exit(0)
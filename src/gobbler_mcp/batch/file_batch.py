@@ -1,5 +1,6 @@
 """File directory batch processing."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Optional
@@ -57,9 +58,10 @@ def scan_directory(
     else:
         glob_pattern = pattern
 
+    # Check the extension first so only candidate paths are stat'ed
     files = []
     for file_path in input_path.glob(glob_pattern):
-        if file_path.is_file() and file_path.suffix.lower() in valid_extensions:
+        if file_path.suffix.lower() in valid_extensions and file_path.is_file():
             files.append(file_path)
 
     logger.info(f"Found {len(files)} {file_type} files in {input_dir}")
@@ -99,7 +101,9 @@ async def process_audio_batch(
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Scan for audio files
-    files = scan_directory(input_dir, pattern, recursive, file_type="audio")
+    files = await asyncio.to_thread(
+        scan_directory, input_dir, pattern, recursive, file_type="audio"
+    )
 
     if not files:
         raise ValueError(f"No audio/video files found in {input_dir}")
@@ -128,14 +132,7 @@ async def process_audio_batch(
             file_path = Path(item.source)
             expected_path = Path(item.metadata["expected_output"])
 
-            # Check if should skip
-            if skip_existing and expected_path.exists():
-                return BatchResult(
-                    item_id=item.id,
-                    success=False,
-                    error="skipped",
-                    metadata={"reason": "File already exists"},
-                )
+            # Existing outputs were already skipped by BatchProcessor (skip_existing)
 
             # Convert to markdown
             markdown, metadata = await convert_audio_to_markdown(
@@ -232,7 +229,9 @@ async def process_document_batch(
     output_path.mkdir(parents=True, exist_ok=True)
 
     # Scan for document files
-    files = scan_directory(input_dir, pattern, recursive, file_type="document")
+    files = await asyncio.to_thread(
+        scan_directory, input_dir, pattern, recursive, file_type="document"
+    )
 
     if not files:
         raise ValueError(f"No document files found in {input_dir}")
@@ -261,14 +260,7 @@ async def process_document_batch(
             file_path = Path(item.source)
             expected_path = Path(item.metadata["expected_output"])
 
-            # Check if should skip
-            if skip_existing and expected_path.exists():
-                return BatchResult(
-                    item_id=item.id,
-                    success=False,
-                    error="skipped",
-                    metadata={"reason": "File already exists"},
-                )
+            # Existing outputs were already skipped by BatchProcessor (skip_existing)
 
             # Convert to markdown
             markdown, metadata = await convert_document_to_markdown(
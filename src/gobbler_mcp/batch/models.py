@@ -1,6 +1,7 @@
 """Data models for batch processing."""
 
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, Dict, Optional
 
 
@@ -106,3 +107,22 @@ class BatchSummary:
         )
 
         return "\n".join(lines)
+
+    def save_report(self) -> str:
+        """
+        Write the full report to the output directory.
+
+        Used by queued batch jobs so the job result stored in Redis stays small
+        however many items the batch had.
+
+        Returns:
+            Short completion message with the report location
+        """
+        report_path = Path(self.output_dir) / f"_report_{self.batch_id}.md"
+        report_path.write_text(self.format_report(), encoding="utf-8")
+
+        return (
+            f"Batch complete: {self.successful}/{self.total_items} succeeded, "
+            f"{self.failed} failed, {self.skipped} skipped\n"
+            f"Full report: {report_path}"
+        )
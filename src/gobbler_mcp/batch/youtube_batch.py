@@ -1,11 +1,10 @@
 """YouTube playlist batch processing."""
 
+import asyncio
 import logging
 from pathlib import Path
 from typing import List, Optional
 
-import yt_dlp
-
 from ..converters.youtube import convert_youtube_to_markdown
 from ..utils import save_markdown_file
 from .batch_manager import BatchProcessor
@@ -18,6 +17,9 @@ async def get_playlist_videos(playlist_url: str, max_videos: int = 100) -> List[
     """
     Extract video URLs and metadata from YouTube playlist.
 
+    The yt-dlp extraction blocks for the whole playlist request, so it runs in
+    a worker thread.
+
     Args:
         playlist_url: YouTube playlist URL
         max_videos: Maximum number of videos to extract
@@ -28,6 +30,13 @@ async def get_playlist_videos(playlist_url: str, max_videos: int = 100) -> List[
     Raises:
         ValueError: If playlist URL is invalid or empty
     """
+    return await asyncio.to_thread(_extract_playlist_videos, playlist_url, max_videos)
+
+
+def _extract_playlist_videos(playlist_url: str, max_videos: int) -> List[dict]:
+    """Extract playlist videos using yt-dlp (blocking, see get_playlist_videos)."""
+    import yt_dlp  # Slow to import; deferred until a playlist is first read
+
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
@@ -79,6 +88,7 @@ async def process_youtube_batch(
     delay_between_requests: float = 1.0,
     jitter_range: float = 0.5,
     max_retries: int = 2,
+    videos: Optional[List[dict]] = None,
 ) -> BatchSummary:
     """
     Process YouTube playlist videos in batch with rate limiting.
@@ -95,12 +105,14 @@ async def process_youtube_batch(
         delay_between_requests: Delay in seconds between requests (default: 1.0)
         jitter_range: Random jitter 0-N seconds added to delay (default: 0.5)
         max_retries: Maximum retry attempts for failed videos (default: 2)
+        videos: Videos already fetched with get_playlist_videos (fetched if None)
 
     Returns:
         BatchSummary with processing results
     """
     # Get playlist videos
-    videos = await get_playlist_videos(playlist_url, max_videos)
+    if videos is None:
+        videos = await get_playlist_videos(playlist_url, max_videos)
 
     # Create output directory
     output_path = Path(output_dir)
@@ -50,12 +50,14 @@ class Config:
         "queue": {
             "auto_queue_threshold": 105,  # seconds (1:45)
             "default_queue": "default",
+            "worker_processes": 1,  # Worker processes started by gobbler_mcp.worker
         },
         "models_path": "~/.gobbler/models",
         "monitoring": {
             "metrics_enabled": False,  # Enable Prometheus metrics collection
             "metrics_port": 9090,  # Port for metrics HTTP endpoint
             "metrics_host": "0.0.0.0",  # Host to bind metrics server
+            "metrics_refresh_seconds": 5,  # Min seconds between resource/queue metric updates
             "log_format": "text",  # 'text' or 'json' (use text for MCP stdio)
             "log_level": "INFO",  # DEBUG, INFO, WARNING, ERROR, CRITICAL
             "health_check_interval": 60,  # Seconds between service health checks
@@ -73,6 +75,7 @@ class Config:
         self.config_path = config_path or self._default_config_path()
         self._lock = threading.RLock()  # Reentrant lock for thread-safety
         self._watcher: Optional[Any] = None  # ConfigWatcher instance
+        self._service_urls: Dict[str, str] = {}  # Built service URLs, cleared on reload
         self.data = self._load_config()
 
     @staticmethod
@@ -158,9 +161,14 @@ class Config:
         Returns:
             Full HTTP URL for service
         """
-        host = self.get(f"services.{service}.host", "localhost")
-        port = self.get(f"services.{service}.port")
-        return f"http://{host}:{port}"
+        with self._lock:
+            url = self._service_urls.get(service)
+            if url is None:
+                host = self.get(f"services.{service}.host", "localhost")
+                port = self.get(f"services.{service}.port")
+                url = f"http://{host}:{port}"
+                self._service_urls[service] = url
+            return url
 
     def reload(self) -> None:
         """
@@ -194,6 +202,7 @@ class Config:
             # Apply new config atomically
             old_config = self.data
             self.data = new_config
+            self._service_urls.clear()
 
             # Log reload success
             if changes:
@@ -8,6 +8,7 @@ from ..config import get_config
 from ..metrics import conversion_size, track_conversion
 from ..utils.file_handler import get_file_extension, validate_input_path
 from ..utils.frontmatter import count_words, create_document_frontmatter
+from ..utils.health import record_service_health
 from ..utils.http_client import RetryableHTTPClient
 
 logger = logging.getLogger(__name__)
@@ -94,6 +95,7 @@ async def convert_document_to_markdown(
         except Exception as e:
             # Check if service is unavailable
             if "ConnectError" in str(type(e).__name__) or "Connection" in str(e):
+                record_service_health(service_url, False)
                 raise RuntimeError(
                     "Docling service unavailable. The service may not be running. "
                     "Start with: docker-compose up -d docling"
@@ -5,10 +5,9 @@ import re
 import time
 from typing import Dict, Tuple
 
-import httpx
-
 from ..config import get_config
 from ..metrics import conversion_size, track_conversion
+from ..utils.crawl4ai_client import run_crawl
 from ..utils.frontmatter import count_words, create_webpage_frontmatter
 from ..utils.health import get_service_unavailable_error
 from ..utils.http_client import RetryableHTTPClient
@@ -63,7 +62,7 @@ async def convert_webpage_to_markdown(
             "crawler_config": {
                 "type": "CrawlerRunConfig",
                 "params": {
-                    "stream": False,
+                    "stream": True,
                     "cache_mode": "bypass"
                 }
             }
@@ -76,53 +75,10 @@ async def convert_webpage_to_markdown(
 
         try:
             async with RetryableHTTPClient(timeout=timeout) as client:
-                # Submit crawl request
-                response = await client.post(
-                    f"{service_url}/crawl",
-                    json=crawl_request,
-                    headers=headers
+                # Submit crawl request and wait for the result
+                result = await run_crawl(
+                    client, service_url, crawl_request, headers, timeout, keep_html=False
                 )
-                response.raise_for_status()
-                task_data = response.json()
-
-                # Get task ID
-                task_id = task_data.get("task_id")
-                if not task_id:
-                    raise RuntimeError("No task_id returned from Crawl4AI")
-
-                # Poll for task completion
-                max_wait = timeout
-                wait_interval = 1  # seconds
-                elapsed = 0
-
-                while elapsed < max_wait:
-                    import asyncio
-                    await asyncio.sleep(wait_interval)
-                    elapsed += wait_interval
-
-                    # Check task status
-                    status_response = await client.get(
-                        f"{service_url}/task/{task_id}",
-                        headers=headers
-                    )
-                    status_response.raise_for_status()
-                    task_status = status_response.json()
-
-                    if task_status.get("status") == "completed":
-                        # Task finished
-                        results = task_status.get("results")
-                        if not results or len(results) == 0:
-                            raise RuntimeError("Crawl4AI returned no results")
-
-                        result = results[0]
-                        break
-                    elif task_status.get("status") == "failed":
-                        error = task_status.get("error", "Unknown error")
-                        raise RuntimeError(f"Crawl4AI task failed: {error}")
-
-                else:
-                    # Timeout waiting for task
-                    raise httpx.TimeoutException(f"Crawl task did not complete within {timeout} seconds")
 
                 # Get markdown content - try different possible field structures
                 markdown_content = None
@@ -1,10 +1,10 @@
 """YouTube transcript conversion module."""
 
+import asyncio
 import logging
 import re
-from typing import Dict, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
-import yt_dlp
 from youtube_transcript_api import (
     NoTranscriptFound,
     TranscriptsDisabled,
@@ -73,6 +73,8 @@ def get_video_metadata(video_url: str) -> Dict[str, Optional[str]]:
     Returns:
         Dictionary with title, channel, thumbnail URL, and description
     """
+    import yt_dlp  # Slow to import; deferred until metadata is first needed
+
     ydl_opts = {
         "quiet": True,
         "no_warnings": True,
@@ -93,6 +95,32 @@ def get_video_metadata(video_url: str) -> Dict[str, Optional[str]]:
         return {"title": None, "channel": None, "thumbnail": None, "description": None}
 
 
+def _fetch_transcript(video_id: str, language: str) -> Tuple[List[Any], str]:
+    """
+    Fetch transcript entries using the YouTube transcript API (blocking).
+
+    Args:
+        video_id: YouTube video ID
+        language: Language code or 'auto'
+
+    Returns:
+        Tuple of (transcript_entries, language_code)
+    """
+    api = YouTubeTranscriptApi()
+    transcript_list = api.list(video_id)
+    if language == "auto":
+        try:
+            transcript = transcript_list.find_generated_transcript(["en"])
+        except:
+            transcript = transcript_list.find_transcript(
+                ["en", "es", "de", "fr", "pt", "ja", "ko", "zh"]
+            )
+        return transcript.fetch(), transcript.language_code
+
+    transcript = transcript_list.find_transcript([language])
+    return transcript.fetch(), language
+
+
 async def convert_youtube_to_markdown(
     video_url: str,
     include_timestamps: bool = False,
@@ -131,26 +159,12 @@ async def convert_youtube_to_markdown(
             },
         )
 
-        # Get video metadata
-        video_metadata = get_video_metadata(video_url)
-
-        # Fetch transcript
-        api = YouTubeTranscriptApi()
-        if language == "auto":
-            transcript_list = api.list(video_id)
-            try:
-                transcript = transcript_list.find_generated_transcript(["en"])
-            except:
-                transcript = transcript_list.find_transcript(
-                    ["en", "es", "de", "fr", "pt", "ja", "ko", "zh"]
-                )
-            transcript_data = transcript.fetch()
-            detected_language = transcript.language_code
-        else:
-            transcript_list = api.list(video_id)
-            transcript = transcript_list.find_transcript([language])
-            transcript_data = transcript.fetch()
-            detected_language = language
+        # Fetch metadata and transcript concurrently; both are blocking network
+        # calls, so run them in worker threads to keep the event loop free
+        video_metadata, (transcript_data, detected_language) = await asyncio.gather(
+            asyncio.to_thread(get_video_metadata, video_url),
+            asyncio.to_thread(_fetch_transcript, video_id, language),
+        )
 
         # Calculate duration
         total_duration = (
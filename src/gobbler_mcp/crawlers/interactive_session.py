@@ -4,12 +4,134 @@ import asyncio
 import logging
 from typing import Dict, Optional
 
-from playwright.async_api import async_playwright
+from playwright.async_api import Browser, Playwright, async_playwright
 
 from .session_manager import SessionManager
 
 logger = logging.getLogger(__name__)
 
+# Shared Playwright driver and headed browser (lazy loaded, reused across sessions)
+_playwright: Optional[Playwright] = None
+_browser: Optional[Browser] = None
+_browser_lock = asyncio.Lock()
+
+# Default instructions page shown while the user logs in (rendered with str.format)
+_DEFAULT_INSTRUCTIONS_HTML = """
+<html>
+<head>
+    <title>Gobbler Session Creator - {session_id}</title>
+    <style>
+        body {{
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
+            max-width: 600px;
+            margin: 100px auto;
+            padding: 40px;
+            background: #f5f5f5;
+        }}
+        .container {{
+            background: white;
+            padding: 40px;
+            border-radius: 12px;
+            box-shadow: 0 2px 8px rgba(0,0,0,0.1);
+        }}
+        h1 {{
+            color: #333;
+            margin-top: 0;
+        }}
+        .step {{
+            margin: 20px 0;
+            padding: 15px;
+            background: #f0f7ff;
+            border-left: 4px solid #0066cc;
+            border-radius: 4px;
+        }}
+        .session-id {{
+            font-family: monospace;
+            background: #eee;
+            padding: 2px 6px;
+            border-radius: 3px;
+        }}
+        .warning {{
+            color: #d93025;
+            font-weight: bold;
+        }}
+    </style>
+</head>
+<body>
+    <div class="container">
+        <h1>🔐 Interactive Session Creator</h1>
+        <p>Creating session: <span class="session-id">{session_id}</span></p>
+
+        <div class="step">
+            <strong>Step 1:</strong> Switch to the other browser tab and log into your account
+        </div>
+
+        <div class="step">
+            <strong>Step 2:</strong> Complete any 2FA or security checks
+        </div>
+
+        <div class="step">
+            <strong>Step 3:</strong> When fully logged in, <span class="warning">close THIS tab</span>
+        </div>
+
+        <p>
+            ℹ️ Closing this tab signals that you're done logging in.
+            All cookies (including HttpOnly) will be automatically extracted and saved.
+        </p>
+
+        <p style="color: #666; font-size: 14px;">
+            ⏱️ Timeout: {timeout} seconds
+        </p>
+    </div>
+</body>
+</html>
+"""
+
+
+async def _get_browser() -> Browser:
+    """
+    Get or launch the shared headed browser.
+
+    Starting Playwright and launching Chromium takes several seconds, so both are
+    kept alive between sessions. Each session gets its own browser context.
+
+    Returns:
+        Connected Browser instance
+    """
+    global _playwright, _browser
+
+    async with _browser_lock:
+        # Return cached browser if still connected (user may have quit it)
+        if _browser is not None and _browser.is_connected():
+            return _browser
+
+        if _playwright is None:
+            _playwright = await async_playwright().start()
+
+        logger.info("Launching browser for interactive sessions")
+        _browser = await _playwright.chromium.launch(
+            headless=False,
+            args=["--disable-blink-features=AutomationControlled"]  # Reduce detection
+        )
+        return _browser
+
+
+async def shutdown() -> None:
+    """Close the shared browser and stop the Playwright driver."""
+    global _playwright, _browser
+
+    async with _browser_lock:
+        if _browser is not None:
+            try:
+                await _browser.close()
+            except Exception as e:
+                logger.debug(f"Error closing browser: {e}")
+            _browser = None
+
+        if _playwright is not None:
+            await _playwright.stop()
+            _playwright = None
+
 
 async def create_interactive_session(
     session_id: str,
@@ -42,185 +164,109 @@ async def create_interactive_session(
         # Browser opens, you log in, close instructions tab when done
         # Session saved with all cookies including HttpOnly
     """
-    default_instructions = f"""
-    <html>
-    <head>
-        <title>Gobbler Session Creator - {session_id}</title>
-        <style>
-            body {{
-                font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif;
-                max-width: 600px;
-                margin: 100px auto;
-                padding: 40px;
-                background: #f5f5f5;
-            }}
-            .container {{
-                background: white;
-                padding: 40px;
-                border-radius: 12px;
-                box-shadow: 0 2px 8px rgba(0,0,0,0.1);
-            }}
-            h1 {{
-                color: #333;
-                margin-top: 0;
-            }}
-            .step {{
-                margin: 20px 0;
-                padding: 15px;
-                background: #f0f7ff;
-                border-left: 4px solid #0066cc;
-                border-radius: 4px;
-            }}
-            .session-id {{
-                font-family: monospace;
-                background: #eee;
-                padding: 2px 6px;
-                border-radius: 3px;
-            }}
-            .warning {{
-                color: #d93025;
-                font-weight: bold;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="container">
-            <h1>🔐 Interactive Session Creator</h1>
-            <p>Creating session: <span class="session-id">{session_id}</span></p>
-
-            <div class="step">
-                <strong>Step 1:</strong> Switch to the other browser tab and log into your account
-            </div>
-
-            <div class="step">
-                <strong>Step 2:</strong> Complete any 2FA or security checks
-            </div>
-
-            <div class="step">
-                <strong>Step 3:</strong> When fully logged in, <span class="warning">close THIS tab</span>
-            </div>
-
-            <p>
-                ℹ️ Closing this tab signals that you're done logging in.
-                All cookies (including HttpOnly) will be automatically extracted and saved.
-            </p>
-
-            <p style="color: #666; font-size: 14px;">
-                ⏱️ Timeout: {timeout} seconds
-            </p>
-        </div>
-    </body>
-    </html>
-    """
-
-    instructions_html = instructions or default_instructions
+    instructions_html = instructions or _DEFAULT_INSTRUCTIONS_HTML.format(
+        session_id=session_id, timeout=timeout
+    )
 
     logger.info(f"Starting interactive session creation for '{session_id}'")
 
-    async with async_playwright() as p:
-        # Launch headed browser
-        browser = await p.chromium.launch(
-            headless=False,
-            args=["--disable-blink-features=AutomationControlled"]  # Reduce detection
-        )
+    browser = await _get_browser()
 
-        try:
-            # Create browser context
-            context = await browser.new_context(
-                viewport={"width": 1280, "height": 720},
-                user_agent=(
-                    "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-                    "AppleWebKit/537.36 (KHTML, like Gecko) "
-                    "Chrome/131.0.0.0 Safari/537.36"
-                ),
-            )
+    # Create an isolated browser context for this session
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 720},
+        user_agent=(
+            "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+            "AppleWebKit/537.36 (KHTML, like Gecko) "
+            "Chrome/131.0.0.0 Safari/537.36"
+        ),
+    )
 
-            # Set page timeout to match our timeout parameter
-            context.set_default_timeout(timeout * 1000)  # Convert to milliseconds
+    try:
+        # Set page timeout to match our timeout parameter
+        context.set_default_timeout(timeout * 1000)  # Convert to milliseconds
 
-            # Open instructions page
-            instructions_page = await context.new_page()
-            await instructions_page.set_content(instructions_html)
+        # Open instructions page
+        instructions_page = await context.new_page()
+        await instructions_page.set_content(instructions_html)
 
-            # Open target site in new tab
-            site_page = await context.new_page()
-            await site_page.goto(start_url, wait_until="domcontentloaded")
+        # Open target site in new tab
+        site_page = await context.new_page()
+        await site_page.goto(start_url, wait_until="domcontentloaded")
 
-            # Bring site page to front
-            await site_page.bring_to_front()
+        # Bring site page to front
+        await site_page.bring_to_front()
 
-            logger.info(
-                f"Browser opened. Navigate to login page and complete authentication. "
-                f"Close the instructions tab when done."
-            )
+        logger.info(
+            f"Browser opened. Navigate to login page and complete authentication. "
+            f"Close the instructions tab when done."
+        )
 
-            # Wait for instructions page to be closed (signals completion)
-            try:
-                await asyncio.wait_for(
-                    instructions_page.wait_for_event("close"),
-                    timeout=timeout
-                )
-                logger.info("Instructions tab closed - extracting cookies")
-            except asyncio.TimeoutError:
-                raise TimeoutError(
-                    f"Interactive session creation timed out after {timeout} seconds"
-                )
-
-            # Extract all cookies from context (includes HttpOnly)
-            cookies = await context.cookies()
-
-            # Convert to session format
-            session_cookies = []
-            for cookie in cookies:
-                session_cookie = {
-                    "name": cookie["name"],
-                    "value": cookie["value"],
-                    "domain": cookie["domain"],
-                    "path": cookie["path"],
-                }
-                # Add optional fields if present
-                if "expires" in cookie and cookie["expires"] != -1:
-                    session_cookie["expires"] = cookie["expires"]
-                if cookie.get("httpOnly"):
-                    session_cookie["httpOnly"] = True
-                if cookie.get("secure"):
-                    session_cookie["secure"] = True
-                if cookie.get("sameSite"):
-                    session_cookie["sameSite"] = cookie["sameSite"]
-
-                session_cookies.append(session_cookie)
-
-            # Save session using SessionManager
-            session_manager = SessionManager()
-            result = await session_manager.create_session(
-                session_id=session_id,
-                cookies=session_cookies,
+        # Wait for instructions page to be closed (signals completion)
+        try:
+            await asyncio.wait_for(
+                instructions_page.wait_for_event("close"),
+                timeout=timeout
             )
-
-            logger.info(
-                f"Session '{session_id}' created with {len(session_cookies)} cookies "
-                f"(including HttpOnly)"
+            logger.info("Instructions tab closed - extracting cookies")
+        except asyncio.TimeoutError:
+            raise TimeoutError(
+                f"Interactive session creation timed out after {timeout} seconds"
             )
 
-            # Close browser
-            await context.close()
-            await browser.close()
-
-            return {
-                "session_id": session_id,
-                "cookies_extracted": len(session_cookies),
-                "http_only_cookies": sum(
-                    1 for c in session_cookies if c.get("httpOnly", False)
-                ),
-                "storage_path": result["file_path"],
-                "domains": list(set(c["domain"] for c in session_cookies)),
+        # Extract all cookies from context (includes HttpOnly)
+        cookies = await context.cookies()
+
+        # Convert to session format
+        session_cookies = []
+        for cookie in cookies:
+            session_cookie = {
+                "name": cookie["name"],
+                "value": cookie["value"],
+                "domain": cookie["domain"],
+                "path": cookie["path"],
             }
+            # Add optional fields if present
+            if "expires" in cookie and cookie["expires"] != -1:
+                session_cookie["expires"] = cookie["expires"]
+            if cookie.get("httpOnly"):
+                session_cookie["httpOnly"] = True
+            if cookie.get("secure"):
+                session_cookie["secure"] = True
+            if cookie.get("sameSite"):
+                session_cookie["sameSite"] = cookie["sameSite"]
+
+            session_cookies.append(session_cookie)
+
+        # Save session using SessionManager
+        session_manager = SessionManager()
+        result = await session_manager.create_session(
+            session_id=session_id,
+            cookies=session_cookies,
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to create interactive session '{session_id}': {e}")
-            # Clean up browser on error
-            try:
-                await browser.close()
-            except Exception:
-                pass
-            raise
+        logger.info(
+            f"Session '{session_id}' created with {len(session_cookies)} cookies "
+            f"(including HttpOnly)"
+        )
+
+        return {
+            "session_id": session_id,
+            "cookies_extracted": len(session_cookies),
+            "http_only_cookies": sum(
+                1 for c in session_cookies if c.get("httpOnly", False)
+            ),
+            "storage_path": result["file_path"],
+            "domains": list(set(c["domain"] for c in session_cookies)),
+        }
+
+    except Exception as e:
+        logger.error(f"Failed to create interactive session '{session_id}': {e}")
+        raise
+
+    finally:
+        # Close only this session's context; the browser is shared
+        try:
+            await context.close()
+        except Exception:
+            pass
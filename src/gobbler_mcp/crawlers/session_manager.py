@@ -1,14 +1,71 @@
 """Browser session management for authenticated crawling."""
 
+import asyncio
 import json
 import logging
+import os
+import tempfile
+import threading
+from collections import OrderedDict
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from ..config import get_config
+from ..utils import json_utils
 
 logger = logging.getLogger(__name__)
 
+# Raw session file bytes keyed by file path, tagged with the file's mtime (LRU order)
+_SESSION_CACHE_SIZE = 64
+_session_cache: "OrderedDict[str, Tuple[int, bytes]]" = OrderedDict()
+_session_cache_lock = threading.Lock()
+
+
+def _invalidate_session_cache(session_file: Path) -> None:
+    """Drop a cached session after it is written or deleted."""
+    with _session_cache_lock:
+        _session_cache.pop(str(session_file), None)
+
+
+def _write_session_file(session_file: Path, session_data: Dict) -> None:
+    """Write session JSON atomically so a crash never leaves a truncated file."""
+    # Unique temp name so concurrent writes of the same session don't collide
+    fd, tmp_path = tempfile.mkstemp(dir=session_file.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_utils.dumps(session_data, indent=True))
+        os.replace(tmp_path, session_file)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+    _invalidate_session_cache(session_file)
+
+
+def _read_session_file(session_file: Path) -> Dict:
+    """
+    Read and parse session JSON, reusing the cached bytes if the file is unchanged.
+
+    Each call parses a fresh dict, so callers can modify the session freely.
+    """
+    key = str(session_file)
+    mtime_ns = session_file.stat().st_mtime_ns
+
+    with _session_cache_lock:
+        cached = _session_cache.get(key)
+        if cached and cached[0] == mtime_ns:
+            _session_cache.move_to_end(key)
+            return json_utils.loads(cached[1])
+
+    raw = session_file.read_bytes()
+
+    with _session_cache_lock:
+        _session_cache[key] = (mtime_ns, raw)
+        _session_cache.move_to_end(key)
+        while len(_session_cache) > _SESSION_CACHE_SIZE:
+            _session_cache.popitem(last=False)
+
+    return json_utils.loads(raw)
+
 
 class SessionManager:
     """Manage browser sessions with cookie and localStorage persistence."""
@@ -69,8 +126,7 @@ class SessionManager:
         session_file = self.sessions_dir / f"{session_id}.json"
 
         try:
-            with open(session_file, "w") as f:
-                json.dump(session_data, f, indent=2)
+            await asyncio.to_thread(_write_session_file, session_file, session_data)
 
             logger.info(
                 f"Created session '{session_id}' with {len(session_data['cookies'])} cookies"
@@ -107,8 +163,7 @@ class SessionManager:
             raise FileNotFoundError(f"Session '{session_id}' not found")
 
         try:
-            with open(session_file, "r") as f:
-                session_data = json.load(f)
+            session_data = await asyncio.to_thread(_read_session_file, session_file)
 
             logger.info(
                 f"Loaded session '{session_id}' with {len(session_data.get('cookies', []))} cookies"
@@ -127,8 +182,9 @@ class SessionManager:
         Returns:
             List of session IDs
         """
-        session_files = self.sessions_dir.glob("*.json")
-        session_ids = [f.stem for f in session_files]
+        session_ids = await asyncio.to_thread(
+            lambda: [f.stem for f in self.sessions_dir.glob("*.json")]
+        )
 
         logger.debug(f"Found {len(session_ids)} sessions")
         return sorted(session_ids)
@@ -150,7 +206,8 @@ class SessionManager:
             return False
 
         try:
-            session_file.unlink()
+            await asyncio.to_thread(session_file.unlink)
+            _invalidate_session_cache(session_file)
             logger.info(f"Deleted session '{session_id}'")
             return True
 
@@ -198,8 +255,7 @@ class SessionManager:
         session_file = self.sessions_dir / f"{session_id}.json"
 
         try:
-            with open(session_file, "w") as f:
-                json.dump(session_data, f, indent=2)
+            await asyncio.to_thread(_write_session_file, session_file, session_data)
 
             logger.info(f"Updated session '{session_id}'")
 
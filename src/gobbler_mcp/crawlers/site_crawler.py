@@ -1,10 +1,13 @@
 """Site crawler for recursive web crawling with link graph generation."""
 
 import asyncio
+import functools
+import itertools
 import logging
 import re
+import sys
 import time
-from collections import deque
+from collections import OrderedDict
 from typing import Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 from urllib.robotparser import RobotFileParser
@@ -12,9 +15,73 @@ from urllib.robotparser import RobotFileParser
 import httpx
 
 from ..converters.webpage_selector import convert_webpage_with_selector
+from ..utils.http_client import close_client_on_loop
 
 logger = logging.getLogger(__name__)
 
+# How long a fetched robots.txt (or a definite 4xx answer) is reused
+ROBOTS_CACHE_TTL = 3600  # seconds
+# How long a transient failure (timeout, 5xx, connection error) is reused
+ROBOTS_FAILURE_CACHE_TTL = 60  # seconds
+ROBOTS_CACHE_SIZE = 256
+
+# robots.txt parsers keyed by "scheme://netloc": (expires_at, parser or None if
+# unavailable), least recently used first
+_robots_cache: "OrderedDict[str, Tuple[float, Optional[RobotFileParser]]]" = OrderedDict()
+
+# Shared client for robots.txt fetches, and in-flight fetches keyed by origin so
+# concurrent crawls of one origin fetch robots.txt once without blocking other
+# origins (lazy loaded, tied to the running event loop)
+_robots_client: Optional[httpx.AsyncClient] = None
+_robots_fetches: Dict[str, "asyncio.Task[Optional[RobotFileParser]]"] = {}
+_robots_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+@functools.lru_cache(maxsize=128)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile URL filter pattern with ASCII matching (cached across crawls)."""
+    return re.compile(pattern, re.ASCII)
+
+
+@functools.lru_cache(maxsize=4096)
+def _get_netloc(url: str) -> str:
+    """Extract the network location of a URL (cached, links repeat across pages)."""
+    return urlparse(url).netloc
+
+
+def _get_robots_client() -> httpx.AsyncClient:
+    """Get or create the shared robots.txt client for the running event loop."""
+    global _robots_client, _robots_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _robots_client_loop is not loop:
+        # Clients and tasks can't be used across event loops; retire the old client
+        # on the loop it belongs to
+        close_client_on_loop(_robots_client, _robots_client_loop)
+        _robots_client = None
+        _robots_fetches.clear()
+        _robots_client_loop = loop
+    if _robots_client is None or _robots_client.is_closed:
+        _robots_client = httpx.AsyncClient(timeout=5.0)
+    return _robots_client
+
+
+def _forget_robots_fetch(origin: str, fetch: asyncio.Future) -> None:
+    """Drop a finished robots.txt fetch unless a newer one replaced it."""
+    if _robots_fetches.get(origin) is fetch:
+        del _robots_fetches[origin]
+
+
+async def shutdown() -> None:
+    """Close the shared robots.txt client."""
+    global _robots_client, _robots_client_loop
+
+    if _robots_client is not None:
+        await _robots_client.aclose()
+    _robots_client = None
+    _robots_fetches.clear()
+    _robots_client_loop = None
+
 
 class SiteCrawler:
     """Recursive site crawler with BFS traversal and link graph generation."""
@@ -22,7 +89,8 @@ class SiteCrawler:
     def __init__(self):
         """Initialize site crawler."""
         self.visited_urls: Set[str] = set()
-        self.link_graph: Dict[str, List[str]] = {}
+        self.visited_domains: Set[str] = set()
+        self.link_graph: Dict[str, Tuple[str, ...]] = {}
 
     async def crawl_site(
         self,
@@ -57,6 +125,7 @@ class SiteCrawler:
         Returns:
             Tuple of (pages_list, crawl_summary)
             - pages_list: List of dicts with {url, markdown, metadata, depth}
+              (metadata excludes the per-page links; see link_graph)
             - crawl_summary: Dict with {total_pages, link_graph, domains, duration_ms}
         """
         # Validate parameters
@@ -70,53 +139,77 @@ class SiteCrawler:
         start_time = time.time()
         base_domain = urlparse(start_url).netloc
 
-        # Compile regex patterns
-        include_regex = re.compile(url_include_pattern) if url_include_pattern else None
-        exclude_regex = re.compile(url_exclude_pattern) if url_exclude_pattern else None
+        # Compile regex patterns, binding the search methods once for the BFS loop
+        include_search = (
+            _compile_pattern(url_include_pattern).search if url_include_pattern else None
+        )
+        exclude_search = (
+            _compile_pattern(url_exclude_pattern).search if url_exclude_pattern else None
+        )
 
         # Check robots.txt
         robots_parser = None
         if respect_robots_txt:
             robots_parser = await self._get_robots_parser(start_url)
 
-        # BFS queue: (url, depth)
-        queue = deque([(start_url, 0)])
+        def in_scope(url: str, netloc: str) -> bool:
+            """Check whether a URL is on the start domain and passes the URL patterns."""
+            # Check same domain
+            if netloc != base_domain:
+                return False
+
+            # Check URL patterns
+            if include_search and not include_search(url):
+                return False
+            if exclude_search and exclude_search(url):
+                return False
+
+            return True
+
+        # BFS frontier ordered by depth, then discovery order:
+        # (depth, seq, url, netloc). Only in-scope URLs are queued, each at most once.
+        queue: asyncio.PriorityQueue = asyncio.PriorityQueue()
+        sequence = itertools.count()
+        if in_scope(start_url, base_domain):
+            queue.put_nowait((0, next(sequence), start_url, base_domain))
+        seen: Set[str] = {start_url}
         pages = []
         self.visited_urls = set()
+        self.visited_domains = set()
         self.link_graph = {}
 
         # Semaphore for concurrency control
         semaphore = asyncio.Semaphore(concurrency)
 
-        async def crawl_page(url: str, depth: int):
-            """Crawl a single page."""
-            async with semaphore:
-                # Check if already visited
-                if url in self.visited_urls:
-                    return
+        # Set once max_pages pages are claimed; remaining frontier entries are skipped
+        stop = asyncio.Event()
 
-                # Check max pages limit
-                if len(self.visited_urls) >= max_pages:
-                    return
+        def should_crawl(url: str) -> bool:
+            """Check whether a queued URL passes the page limit and robots.txt."""
+            # Check max pages limit
+            if len(self.visited_urls) >= max_pages:
+                return False
 
-                # Check same domain
-                if urlparse(url).netloc != base_domain:
-                    return
+            # Check robots.txt
+            if robots_parser and not robots_parser.can_fetch("*", url):
+                logger.debug(f"Robots.txt disallows: {url}")
+                return False
 
-                # Check URL patterns
-                if include_regex and not include_regex.search(url):
-                    return
-                if exclude_regex and exclude_regex.search(url):
-                    return
+            return True
 
-                # Check robots.txt
-                if robots_parser and not robots_parser.can_fetch("*", url):
-                    logger.debug(f"Robots.txt disallows: {url}")
-                    return
+        async def crawl_page(url: str, depth: int, netloc: str):
+            """Crawl a single page."""
+            # Cheap rejects happen before taking a semaphore slot
+            if not should_crawl(url):
+                return
 
-                # Mark as visited
-                self.visited_urls.add(url)
+            # Mark as visited
+            self.visited_urls.add(url)
+            self.visited_domains.add(netloc)
+            if len(self.visited_urls) >= max_pages:
+                stop.set()
 
+            async with semaphore:
                 # Polite crawling delay
                 if crawl_delay > 0:
                     await asyncio.sleep(crawl_delay)
@@ -131,13 +224,25 @@ class SiteCrawler:
                         use_stealth=use_stealth,
                     )
 
-                    # Extract links for next depth
-                    links_data = metadata.get("links", {})
-                    internal_links = links_data.get("internal_links", [])
-                    link_urls = [link["url"] for link in internal_links]
+                    # Collect links for the graph and queue new in-scope ones in one pass.
+                    # The full links dict is dropped from the page metadata afterwards;
+                    # only the (interned) URLs are kept in the link graph.
+                    links_data = metadata.pop("links", None) or {}
+                    link_urls = []
+                    for link in links_data.get("internal_links", ()):
+                        link_url = sys.intern(link["url"])
+                        link_urls.append(link_url)
+
+                        if depth >= max_depth or link_url in seen:
+                            continue
+                        seen.add(link_url)
+
+                        link_netloc = _get_netloc(link_url)
+                        if in_scope(link_url, link_netloc):
+                            queue.put_nowait((depth + 1, next(sequence), link_url, link_netloc))
 
                     # Store in link graph
-                    self.link_graph[url] = link_urls
+                    self.link_graph[url] = tuple(link_urls)
 
                     # Add page to results
                     pages.append({
@@ -147,36 +252,37 @@ class SiteCrawler:
                         "depth": depth,
                     })
 
-                    # Queue links for next depth
-                    if depth < max_depth:
-                        for link_url in link_urls:
-                            if link_url not in self.visited_urls:
-                                queue.append((link_url, depth + 1))
-
                     logger.info(f"Crawled ({depth}): {url} - {len(link_urls)} links")
 
                 except Exception as e:
                     logger.error(f"Failed to crawl {url}: {e}")
 
-        # Process queue
-        while queue and len(self.visited_urls) < max_pages:
-            url, depth = queue.popleft()
-
-            # Skip if already visited
-            if url in self.visited_urls:
-                continue
+        async def worker():
+            """Crawl pages from the frontier until cancelled."""
+            while True:
+                depth, _, url, netloc = await queue.get()
+                try:
+                    if not stop.is_set():
+                        await crawl_page(url, depth, netloc)
+                finally:
+                    queue.task_done()
 
-            # Crawl page
-            await crawl_page(url, depth)
+        # Process queue with `concurrency` workers until the frontier is drained
+        workers = [asyncio.create_task(worker()) for _ in range(concurrency)]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
 
         # Generate summary
         duration_ms = int((time.time() - start_time) * 1000)
-        domains = set(urlparse(url).netloc for url in self.visited_urls)
 
         summary = {
             "total_pages": len(pages),
             "link_graph": self.link_graph,
-            "domains": list(domains),
+            "domains": list(self.visited_domains),
             "duration_ms": duration_ms,
             "max_depth_reached": max(p["depth"] for p in pages) if pages else 0,
         }
@@ -188,21 +294,64 @@ class SiteCrawler:
         return pages, summary
 
     async def _get_robots_parser(self, url: str) -> Optional[RobotFileParser]:
-        """Fetch and parse robots.txt for the given URL."""
+        """Get robots.txt parser for the URL's host, reusing it until its cache entry expires."""
         parsed = urlparse(url)
-        robots_url = f"{parsed.scheme}://{parsed.netloc}/robots.txt"
+        origin = f"{parsed.scheme}://{parsed.netloc}"
+
+        cached = _robots_cache.get(origin)
+        if cached and time.monotonic() < cached[0]:
+            _robots_cache.move_to_end(origin)
+            return cached[1]
+
+        # Join an in-flight fetch for this origin rather than starting another
+        _get_robots_client()
+        fetch = _robots_fetches.get(origin)
+        if fetch is None:
+            fetch = asyncio.create_task(self._load_robots_parser(origin))
+            _robots_fetches[origin] = fetch
+            fetch.add_done_callback(functools.partial(_forget_robots_fetch, origin))
+
+        # Shield so one cancelled crawl doesn't cancel the fetch for the others
+        return await asyncio.shield(fetch)
+
+    async def _load_robots_parser(self, origin: str) -> Optional[RobotFileParser]:
+        """Fetch robots.txt for the origin and store it in the cache."""
+        parser, ttl = await self._fetch_robots_parser(origin)
+        _robots_cache[origin] = (time.monotonic() + ttl, parser)
+        _robots_cache.move_to_end(origin)
+        while len(_robots_cache) > ROBOTS_CACHE_SIZE:
+            _robots_cache.popitem(last=False)
+        return parser
+
+    async def _fetch_robots_parser(
+        self, origin: str
+    ) -> Tuple[Optional[RobotFileParser], float]:
+        """
+        Fetch and parse robots.txt for the given origin.
+
+        Returns:
+            Tuple of (parser or None if unavailable, seconds to cache the result).
+            Parsed files and definite 4xx answers are cached for ROBOTS_CACHE_TTL;
+            transient failures only for ROBOTS_FAILURE_CACHE_TTL so a brief outage
+            doesn't disable robots.txt for the origin for an hour.
+        """
+        robots_url = f"{origin}/robots.txt"
 
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(robots_url)
-                response.raise_for_status()
+            response = await _get_robots_client().get(robots_url)
+            response.raise_for_status()
 
-                parser = RobotFileParser()
-                parser.parse(response.text.splitlines())
+            parser = RobotFileParser()
+            parser.parse(response.text.splitlines())
 
-                logger.debug(f"Loaded robots.txt from {robots_url}")
-                return parser
+            logger.debug(f"Loaded robots.txt from {robots_url}")
+            return parser, ROBOTS_CACHE_TTL
+
+        except httpx.HTTPStatusError as e:
+            ttl = ROBOTS_CACHE_TTL if e.response.is_client_error else ROBOTS_FAILURE_CACHE_TTL
+            logger.debug(f"Could not fetch robots.txt from {robots_url}: {e}")
+            return None, ttl
 
         except Exception as e:
             logger.debug(f"Could not fetch robots.txt from {robots_url}: {e}")
-            return None
+            return None, ROBOTS_FAILURE_CACHE_TTL
@@ -11,13 +11,78 @@ from aiohttp import web
 from bs4 import BeautifulSoup
 from markdownify import markdownify as md
 
+from .utils import json_utils
 from .utils.frontmatter import count_words, create_webpage_frontmatter
 
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # selectolax is optional (pip install gobbler-mcp[fast])
+    LexborHTMLParser = None
+
 logger = logging.getLogger(__name__)
 
+# Elements stripped from extracted pages before markdown conversion
+STRIPPED_TAGS = ("script", "style", "nav", "header", "footer")
+
+# A line break plus surrounding spaces/tabs, including runs of blank lines
+_LINE_BREAK_RE = re.compile(r"[^\S\n]*(?:\n[^\S\n]*)+")
+
+
+def _collapse_line_break(match: re.Match) -> str:
+    """Replace a line break run with one newline, or a blank line for 2+."""
+    return "\n" * min(match.group().count("\n"), 2)
+
+
 # Global WebSocket connections and command queue
 websocket_connections = set()
-pending_commands = {}  # command_id -> {event: asyncio.Event, response: dict}
+pending_commands: Dict[str, asyncio.Future] = {}  # command_id -> response future
+
+
+def _json_response(data: Dict, status: int = 200) -> web.Response:
+    """Build a JSON response, serialized with orjson when available."""
+    return web.Response(
+        body=json_utils.dumps(data),
+        status=status,
+        content_type="application/json",
+    )
+
+
+async def _send_json(ws: web.WebSocketResponse, data: Dict) -> None:
+    """Send a JSON text frame over a WebSocket."""
+    await ws.send_str(json_utils.dumps(data).decode("utf-8"))
+
+
+def _clean_html(html: str, selector: Optional[str] = None) -> Optional[str]:
+    """
+    Narrow HTML to the selected element and strip non-content tags.
+
+    Uses the C-backed lexbor parser from selectolax when installed and falls
+    back to BeautifulSoup otherwise. The document is parsed once either way.
+
+    Args:
+        html: Full page HTML
+        selector: Optional CSS selector to extract
+
+    Returns:
+        Cleaned HTML fragment, or None if the selector matched nothing
+    """
+    if LexborHTMLParser is not None:
+        tree = LexborHTMLParser(html)
+        root = tree.css_first(selector) if selector else tree.root
+        if root is None:
+            return None
+        for node in root.css(",".join(STRIPPED_TAGS)):
+            node.decompose()
+        return root.html or ""
+
+    root = BeautifulSoup(html, "html.parser")
+    if selector:
+        root = root.select_one(selector)
+        if root is None:
+            return None
+    for tag in root(list(STRIPPED_TAGS)):
+        tag.decompose()
+    return str(root)
 
 
 async def extract_handler(request: web.Request) -> web.Response:
@@ -40,36 +105,29 @@ async def extract_handler(request: web.Request) -> web.Response:
     }
     """
     try:
-        data = await request.json()
+        data = json_utils.loads(await request.read())
 
         url = data.get("url", "")
         title = data.get("title", "Unknown Page")
-        html = data.get("html", "")
-        text = data.get("text", "")
         selector = data.get("selector")
 
-        # Convert HTML to markdown preserving links
-        soup = BeautifulSoup(html, "html.parser")
-
-        # If selector provided, extract only that element
-        if selector:
-            element = soup.select_one(selector)
-            if element:
-                soup = BeautifulSoup(str(element), "html.parser")
-            else:
-                return web.json_response(
-                    {"error": f"Selector '{selector}' not found"},
-                    status=400
-                )
+        # Take the page HTML (up to 50MB) out of the payload so only one
+        # reference exists and it can be freed as soon as it is cleaned
+        html = data.pop("html", "")
 
-        # Remove scripts, styles, and navigation elements
-        for script in soup(["script", "style", "nav", "header", "footer"]):
-            script.decompose()
+        # Extract selected element (if any) and remove scripts, styles, and navigation
+        content_html = _clean_html(html, selector)
+        del html
+        if content_html is None:
+            return _json_response(
+                {"error": f"Selector '{selector}' not found"},
+                status=400
+            )
 
         # Convert HTML to markdown using markdownify
         # This preserves links in [text](url) format
         markdown_content = md(
-            str(soup),
+            content_html,
             heading_style="ATX",  # Use # for headings
             bullets="-",  # Use - for bullet points
             strip=["script", "style"],  # Strip these tags
@@ -77,45 +135,21 @@ async def extract_handler(request: web.Request) -> web.Response:
             escape_underscores=False,  # Don't escape _ in markdown
         )
 
-        # Clean up excessive newlines (3+ newlines -> 2 newlines)
-        markdown_content = re.sub(r'\n{3,}', '\n\n', markdown_content)
-
-        # Clean up excessive spaces at line starts/ends
-        markdown_content = '\n'.join(line.strip() for line in markdown_content.split('\n'))
-
-        # Remove leading/trailing whitespace
-        markdown_content = markdown_content.strip()
+        # Strip spaces at line starts/ends and collapse 3+ newlines to 2 in one pass
+        markdown_content = _LINE_BREAK_RE.sub(_collapse_line_break, markdown_content).strip()
 
         # Create frontmatter
         word_count = count_words(markdown_content)
+        extra_fields = {"selector": selector} if selector else {}
+        extra_fields["source"] = "browser_extension"
         frontmatter = create_webpage_frontmatter(
             url=url,
             title=title,
             word_count=word_count,
             conversion_time_ms=0,
+            extra_fields=extra_fields,
         )
 
-        # Add selector info if present
-        if selector:
-            lines = frontmatter.split('\n')
-            frontmatter_lines = []
-            for line in lines:
-                frontmatter_lines.append(line)
-                if line == '---' and len(frontmatter_lines) > 1:
-                    frontmatter_lines.insert(-1, f'selector: {selector}')
-                    frontmatter_lines.insert(-1, 'source: browser_extension')
-                    break
-            frontmatter = '\n'.join(frontmatter_lines)
-        else:
-            lines = frontmatter.split('\n')
-            frontmatter_lines = []
-            for line in lines:
-                frontmatter_lines.append(line)
-                if line == '---' and len(frontmatter_lines) > 1:
-                    frontmatter_lines.insert(-1, 'source: browser_extension')
-                    break
-            frontmatter = '\n'.join(frontmatter_lines)
-
         # Combine frontmatter and content
         full_markdown = frontmatter + markdown_content
 
@@ -131,14 +165,14 @@ async def extract_handler(request: web.Request) -> web.Response:
 
         logger.info(f"Extracted content from browser extension: {url}")
 
-        return web.json_response({
+        return _json_response({
             "markdown": full_markdown,
             "metadata": metadata
         })
 
     except Exception as e:
         logger.error(f"Extension extraction error: {e}", exc_info=True)
-        return web.json_response(
+        return _json_response(
             {"error": str(e)},
             status=500
         )
@@ -146,7 +180,7 @@ async def extract_handler(request: web.Request) -> web.Response:
 
 async def health_handler(request: web.Request) -> web.Response:
     """Health check endpoint."""
-    return web.json_response({
+    return _json_response({
         "status": "ok",
         "websocket_connections": len(websocket_connections)
     })
@@ -169,23 +203,22 @@ async def websocket_handler(request: web.Request) -> web.WebSocketResponse:
         async for msg in ws:
             if msg.type == web.WSMsgType.TEXT:
                 try:
-                    data = json.loads(msg.data)
+                    data = json_utils.loads(msg.data)
                     message_type = data.get("type")
 
                     if message_type == "command_response":
                         # Handle response to a command we sent
-                        command_id = data.get("command_id")
-                        if command_id in pending_commands:
-                            pending_commands[command_id]["response"] = data.get("result", {})
-                            pending_commands[command_id]["event"].set()
+                        future = pending_commands.get(data.get("command_id"))
+                        if future and not future.done():
+                            future.set_result(data.get("result", {}))
 
                     elif message_type == "ping":
                         # Respond to ping with pong
-                        await ws.send_json({"type": "pong"})
+                        await _send_json(ws, {"type": "pong"})
 
                     elif message_type == "register":
                         # Extension registered successfully
-                        await ws.send_json({
+                        await _send_json(ws, {
                             "type": "registered",
                             "server_version": "0.1.0"
                         })
@@ -229,12 +262,9 @@ async def send_command_to_extension(
     # Generate unique command ID
     command_id = str(uuid.uuid4())
 
-    # Create event to wait for response
-    event = asyncio.Event()
-    pending_commands[command_id] = {
-        "event": event,
-        "response": None
-    }
+    # Create future resolved by the WebSocket handler with the response
+    future = asyncio.get_running_loop().create_future()
+    pending_commands[command_id] = future
 
     # Prepare command message
     message = {
@@ -245,15 +275,21 @@ async def send_command_to_extension(
     }
 
     try:
-        # Send to all connected extensions (usually just one)
-        for ws in websocket_connections:
-            await ws.send_json(message)
-            logger.info(f"Sent command '{command}' to extension (id: {command_id})")
+        # Send to all connected extensions concurrently (usually just one), serializing once.
+        # Snapshot the set since extensions may disconnect while sends are in flight.
+        frame = json_utils.dumps(message).decode("utf-8")
+        results = await asyncio.gather(
+            *(ws.send_str(frame) for ws in list(websocket_connections)),
+            return_exceptions=True,
+        )
+        for result in results:
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to send command '{command}' to extension: {result}")
+        logger.info(f"Sent command '{command}' to extension (id: {command_id})")
 
         # Wait for response with timeout
         try:
-            await asyncio.wait_for(event.wait(), timeout=timeout)
-            response = pending_commands[command_id]["response"]
+            response = await asyncio.wait_for(future, timeout=timeout)
 
             if response is None:
                 raise RuntimeError("Extension response was empty")
@@ -3,16 +3,36 @@
 Supports both JSON (production) and text (development/MCP) logging formats.
 """
 
-import json
 import logging
 import sys
-from datetime import datetime, timezone
-from typing import Any, Dict, Optional
+import time
+from typing import Any, Dict, Optional, Tuple
+
+from .utils import json_utils
 
 
 class StructuredFormatter(logging.Formatter):
     """JSON formatter for structured logging."""
 
+    def __init__(self, *args: Any, **kwargs: Any):
+        """Initialize formatter with an empty timestamp cache."""
+        super().__init__(*args, **kwargs)
+        # (whole second, formatted "YYYY-MM-DDTHH:MM:SS") of the last record
+        self._second_cache: Tuple[int, str] = (-1, "")
+
+    def _format_timestamp(self, created: float) -> str:
+        """
+        Format record time as UTC ISO 8601, e.g. "2025-10-02T14:32:11.123456+00:00".
+
+        The date/time prefix is reused for records within the same second.
+        """
+        second = int(created)
+        cached_second, prefix = self._second_cache
+        if second != cached_second:
+            prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(second))
+            self._second_cache = (second, prefix)
+        return f"{prefix}.{int((created - second) * 1_000_000):06d}+00:00"
+
     def format(self, record: logging.LogRecord) -> str:
         """
         Format log record as JSON.
@@ -24,7 +44,7 @@ class StructuredFormatter(logging.Formatter):
             JSON-formatted log string
         """
         log_data: Dict[str, Any] = {
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "timestamp": self._format_timestamp(record.created),
             "level": record.levelname,
             "logger": record.name,
             "message": record.getMessage(),
@@ -45,7 +65,7 @@ class StructuredFormatter(logging.Formatter):
         if hasattr(record, "extra_fields"):
             log_data.update(record.extra_fields)
 
-        return json.dumps(log_data)
+        return json_utils.dumps(log_data).decode("utf-8")
 
 
 def setup_logging(
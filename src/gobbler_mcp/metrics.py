@@ -1,9 +1,11 @@
 """Prometheus metrics definitions and tracking for Gobbler MCP server."""
 
+import functools
+import threading
 import time
-from typing import Optional
+from types import ModuleType
+from typing import List, Optional, Tuple
 
-import psutil
 from prometheus_client import (
     CONTENT_TYPE_LATEST,
     CollectorRegistry,
@@ -13,20 +15,28 @@ from prometheus_client import (
     Info,
     generate_latest,
 )
+from prometheus_client.openmetrics.exposition import (
+    CONTENT_TYPE_LATEST as OPENMETRICS_CONTENT_TYPE,
+    generate_latest as generate_openmetrics,
+)
 
 # Create registry
 registry = CollectorRegistry()
 
-# Application info
+# Application info (static, so kept in its own registry and rendered once)
+info_registry = CollectorRegistry()
 app_info = Info(
     "gobbler_app",
     "Gobbler MCP Server Information",
-    registry=registry,
+    registry=info_registry,
 )
 app_info.info({
     "version": "0.1.0",
     "python_version": "3.11",
 })
+_APP_INFO_BYTES = generate_latest(info_registry)
+# OpenMetrics output ends with "# EOF"; keep only the info lines to prepend
+_APP_INFO_OPENMETRICS_BYTES = generate_openmetrics(info_registry).removesuffix(b"# EOF\n")
 
 # Conversion metrics
 conversion_total = Counter(
@@ -40,7 +50,7 @@ conversion_duration = Histogram(
     "gobbler_conversion_duration_seconds",
     "Time spent on conversions",
     ["converter_type"],
-    buckets=[0.5, 1, 2, 5, 10, 30, 60, 120, 300],  # 0.5s to 5min
+    buckets=(0.5, 1, 2, 5, 10, 30, 60, 120, 300),  # 0.5s to 5min
     registry=registry,
 )
 
@@ -48,7 +58,7 @@ conversion_size = Histogram(
     "gobbler_conversion_size_bytes",
     "Size of content converted",
     ["converter_type"],
-    buckets=[1024, 10240, 102400, 1048576, 10485760, 104857600],  # 1KB to 100MB
+    buckets=(1024, 10240, 102400, 1048576, 10485760, 104857600),  # 1KB to 100MB
     registry=registry,
 )
 
@@ -56,7 +66,7 @@ conversion_size = Histogram(
 queue_depth = Gauge(
     "gobbler_queue_depth",
     "Number of jobs in queue",
-    ["queue_name"],  # default, transcription, download
+    ["queue_name"],  # default, playlist, transcription, download
     registry=registry,
 )
 
@@ -64,7 +74,7 @@ queue_processing_time = Histogram(
     "gobbler_queue_processing_seconds",
     "Time spent processing queued jobs",
     ["queue_name", "job_type"],
-    buckets=[1, 5, 10, 30, 60, 300, 600, 1800],  # 1s to 30min
+    buckets=(1, 5, 10, 30, 60, 300, 600, 1800),  # 1s to 30min
     registry=registry,
 )
 
@@ -80,7 +90,7 @@ service_response_time = Histogram(
     "gobbler_service_response_seconds",
     "Service response time",
     ["service_name"],
-    buckets=[0.1, 0.5, 1, 2, 5, 10],  # 100ms to 10s
+    buckets=(0.1, 0.5, 1, 2, 5, 10),  # 100ms to 10s
     registry=registry,
 )
 
@@ -94,7 +104,7 @@ worker_active = Gauge(
 worker_idle_time = Histogram(
     "gobbler_worker_idle_seconds",
     "Time workers spend idle between jobs",
-    buckets=[1, 5, 10, 30, 60, 300],  # 1s to 5min
+    buckets=(1, 5, 10, 30, 60, 300),  # 1s to 5min
     registry=registry,
 )
 
@@ -142,9 +152,79 @@ batch_items_processed = Counter(
 )
 
 
+# Mounted partitions are effectively static, so the list is refreshed only periodically
+PARTITION_REFRESH_SECONDS = 300
+
+# Block-device filesystems reported in disk metrics (skips tmpfs, overlay, squashfs, etc.)
+DISK_FSTYPES = frozenset({
+    "ext2", "ext3", "ext4", "xfs", "btrfs", "zfs", "f2fs",
+    "apfs", "hfs", "hfsplus", "ntfs", "exfat", "vfat",
+})
+_partitions: List = []
+_partitions_refreshed_at: Optional[float] = None
+
+# Dynamic metrics are refreshed at most once per refresh interval; scrapes in
+# between reuse the gauges' last values
+_last_update: Optional[float] = None
+
+# psutil module (lazy loaded on first resource metrics update)
+_psutil: Optional[ModuleType] = None
+
+# Latest CPU usage from the background sampler (None until the sampler is started)
+CPU_SAMPLE_INTERVAL = 1.0  # seconds
+_cpu_latest: Optional[float] = None
+_cpu_sampler_thread: Optional[threading.Thread] = None
+
+
+# RQ queues reported in queue depth metrics (same as utils.queue.QUEUE_NAMES; not
+# imported from there so importing metrics doesn't load rq)
+QUEUE_NAMES = ("default", "playlist", "transcription", "download")
+
+# Converter types whose labeled metrics are bound at import
+CONVERTER_TYPES = ("youtube", "audio", "webpage", "document")
+
+
+@functools.lru_cache(maxsize=128)
+def _conversion_metrics(converter_type: str) -> Tuple:
+    """
+    Get bound (success counter, failure counter, duration histogram) for a converter.
+
+    Caching the labeled children skips prometheus_client's label lookup per conversion.
+    """
+    return (
+        conversion_total.labels(converter_type=converter_type, status="success"),
+        conversion_total.labels(converter_type=converter_type, status="failure"),
+        conversion_duration.labels(converter_type=converter_type),
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _error_counter(error_type: str, converter_type: str) -> Counter:
+    """Get bound error counter for an error type and converter."""
+    return errors_total.labels(error_type=error_type, converter_type=converter_type)
+
+
+@functools.lru_cache(maxsize=None)
+def _queue_depth_gauge(queue_name: str) -> Gauge:
+    """Get bound queue depth gauge for a queue."""
+    return queue_depth.labels(queue_name=queue_name)
+
+
+@functools.lru_cache(maxsize=64)
+def _disk_usage_gauge(mount_point: str) -> Gauge:
+    """Get bound disk usage gauge for a mount point."""
+    return disk_usage.labels(mount_point=mount_point)
+
+
+for _converter_type in CONVERTER_TYPES:
+    _conversion_metrics(_converter_type)
+
+
 class ConversionTracker:
     """Context manager for tracking conversion operations."""
 
+    __slots__ = ("converter_type", "start_time")
+
     def __init__(self, converter_type: str):
         """
         Initialize conversion tracker.
@@ -157,7 +237,7 @@ class ConversionTracker:
 
     def __enter__(self) -> "ConversionTracker":
         """Start tracking conversion."""
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
         return self
 
     def __exit__(
@@ -177,22 +257,20 @@ class ConversionTracker:
         if self.start_time is None:
             return
 
-        duration = time.time() - self.start_time
-        conversion_duration.labels(converter_type=self.converter_type).observe(duration)
+        success_total, failure_total, duration_histogram = _conversion_metrics(
+            self.converter_type
+        )
+
+        duration = time.monotonic() - self.start_time
+        duration_histogram.observe(duration)
 
         if exc_type is None:
             # Success
-            conversion_total.labels(
-                converter_type=self.converter_type, status="success"
-            ).inc()
+            success_total.inc()
         else:
             # Failure
-            conversion_total.labels(
-                converter_type=self.converter_type, status="failure"
-            ).inc()
-            errors_total.labels(
-                error_type=exc_type.__name__, converter_type=self.converter_type
-            ).inc()
+            failure_total.inc()
+            _error_counter(exc_type.__name__, self.converter_type).inc()
 
 
 def track_conversion(converter_type: str) -> ConversionTracker:
@@ -213,21 +291,89 @@ def track_conversion(converter_type: str) -> ConversionTracker:
     return ConversionTracker(converter_type)
 
 
+def _get_psutil() -> ModuleType:
+    """
+    Get psutil, importing it on first use.
+
+    Importing psutil reads system information, so it is deferred until metrics are
+    actually collected.
+
+    Returns:
+        psutil module
+    """
+    global _psutil
+
+    if _psutil is None:
+        import psutil
+
+        # Prime system-wide CPU sampling so non-blocking reads report usage since the
+        # previous call
+        psutil.cpu_percent(interval=None)
+        _psutil = psutil
+    return _psutil
+
+
+def _get_partitions() -> List:
+    """Get mounted block-device partitions, rescanning every PARTITION_REFRESH_SECONDS."""
+    global _partitions, _partitions_refreshed_at
+
+    now = time.monotonic()
+    stale = (
+        _partitions_refreshed_at is None
+        or now - _partitions_refreshed_at > PARTITION_REFRESH_SECONDS
+    )
+    if stale:
+        _partitions = [
+            partition
+            for partition in _get_psutil().disk_partitions(all=False)
+            if partition.fstype.lower() in DISK_FSTYPES
+        ]
+        _partitions_refreshed_at = now
+    return _partitions
+
+
+def _cpu_sampler() -> None:
+    """Sample CPU usage continuously (runs in a daemon thread)."""
+    global _cpu_latest
+
+    psutil = _get_psutil()
+    while True:
+        _cpu_latest = psutil.cpu_percent(interval=CPU_SAMPLE_INTERVAL)
+
+
+def start_cpu_sampler() -> None:
+    """Start the background CPU sampler thread if it is not already running."""
+    global _cpu_sampler_thread
+
+    if _cpu_sampler_thread is not None and _cpu_sampler_thread.is_alive():
+        return
+
+    _cpu_sampler_thread = threading.Thread(
+        target=_cpu_sampler, name="gobbler-cpu-sampler", daemon=True
+    )
+    _cpu_sampler_thread.start()
+
+
 def update_resource_metrics() -> None:
     """Update system resource metrics (CPU, memory, disk)."""
     try:
-        # CPU usage
-        cpu_usage.set(psutil.cpu_percent(interval=0.1))
+        psutil = _get_psutil()
+
+        # CPU usage from the background sampler, or since the previous call without it
+        cpu_percent = _cpu_latest
+        if cpu_percent is None:
+            cpu_percent = psutil.cpu_percent(interval=None)
+        cpu_usage.set(cpu_percent)
 
         # Memory usage
         memory = psutil.virtual_memory()
         memory_usage.set(memory.used)
 
         # Disk usage for all partitions
-        for partition in psutil.disk_partitions():
+        for partition in _get_partitions():
             try:
                 usage = psutil.disk_usage(partition.mountpoint)
-                disk_usage.labels(mount_point=partition.mountpoint).set(usage.percent)
+                _disk_usage_gauge(partition.mountpoint).set(usage.percent)
             except (PermissionError, OSError):
                 # Skip partitions we can't access
                 pass
@@ -236,33 +382,58 @@ def update_resource_metrics() -> None:
         pass
 
 
+@functools.lru_cache(maxsize=1)
+def _queue_keys() -> Tuple[str, ...]:
+    """Get the Redis list keys backing the monitored RQ queues."""
+    from rq import Queue
+
+    return tuple(Queue.redis_queue_namespace_prefix + name for name in QUEUE_NAMES)
+
+
 def update_queue_metrics() -> None:
     """Update queue depth metrics from Redis."""
     try:
-        from .utils.queue import get_queue
+        from .utils.queue import get_metrics_redis_connection
 
-        for queue_name in ["default", "transcription", "download"]:
-            try:
-                queue = get_queue(queue_name)
-                depth = len(queue)
-                queue_depth.labels(queue_name=queue_name).set(depth)
-            except Exception:
-                # Queue might not be available (Redis down)
-                pass
+        # One pipelined round trip on the raw connection (no RQ Queue objects)
+        pipe = get_metrics_redis_connection().pipeline(transaction=False)
+        for key in _queue_keys():
+            pipe.llen(key)
+        depths = pipe.execute()
+
+        for queue_name, depth in zip(QUEUE_NAMES, depths):
+            _queue_depth_gauge(queue_name).set(depth)
     except Exception:
-        # Don't let metrics collection crash the application
+        # Redis down or slow (timeout): leave the gauges stale rather than fail the scrape
         pass
 
 
-def get_metrics() -> tuple[bytes, str]:
+def get_metrics(openmetrics: bool = False) -> tuple[bytes, str]:
     """
     Get Prometheus metrics in text format.
 
+    Args:
+        openmetrics: Render in OpenMetrics text format instead of the
+            Prometheus text format
+
     Returns:
         Tuple of (metrics_data, content_type)
     """
-    # Update dynamic metrics before generating output
-    update_resource_metrics()
-    update_queue_metrics()
-
-    return generate_latest(registry), CONTENT_TYPE_LATEST
+    global _last_update
+
+    from .config import get_config
+
+    # Update dynamic metrics before generating output, unless updated recently
+    refresh_seconds = get_config().get("monitoring.metrics_refresh_seconds", 5)
+    now = time.monotonic()
+    if _last_update is None or now - _last_update >= refresh_seconds:
+        update_resource_metrics()
+        update_queue_metrics()
+        _last_update = now
+
+    if openmetrics:
+        return (
+            _APP_INFO_OPENMETRICS_BYTES + generate_openmetrics(registry),
+            OPENMETRICS_CONTENT_TYPE,
+        )
+    return _APP_INFO_BYTES + generate_latest(registry), CONTENT_TYPE_LATEST
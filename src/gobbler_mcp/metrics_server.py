@@ -2,15 +2,20 @@
 
 import asyncio
 import logging
-import threading
 from typing import Optional
 
 from aiohttp import web
+from prometheus_client import CONTENT_TYPE_LATEST
 
-from .metrics import get_metrics
+from .metrics import OPENMETRICS_CONTENT_TYPE, get_metrics, start_cpu_sampler
 
 logger = logging.getLogger(__name__)
 
+# Prometheus content type ("text/plain; version=X.X.X; charset=utf-8") passed through
+# verbatim, so aiohttp doesn't rebuild it from content_type/charset per request
+_METRICS_HEADERS = {"Content-Type": CONTENT_TYPE_LATEST}
+_OPENMETRICS_HEADERS = {"Content-Type": OPENMETRICS_CONTENT_TYPE}
+
 
 async def metrics_handler(request: web.Request) -> web.Response:
     """
@@ -23,16 +28,21 @@ async def metrics_handler(request: web.Request) -> web.Response:
         Response with Prometheus metrics
     """
     try:
-        metrics_data, content_type_full = get_metrics()
-        # Extract just the content type without charset for aiohttp
-        # Prometheus returns "text/plain; version=X.X.X; charset=utf-8"
-        # aiohttp wants content_type without charset (charset is separate param)
-        content_type = content_type_full.split(";")[0].strip()
-        return web.Response(
+        # Serve OpenMetrics to scrapers that advertise it (Prometheus 2.x does)
+        openmetrics = "application/openmetrics-text" in request.headers.get("Accept", "")
+
+        # Collection makes blocking psutil and Redis calls; keep them off the event loop
+        metrics_data, _ = await asyncio.to_thread(get_metrics, openmetrics)
+        response = web.Response(
             body=metrics_data,
-            content_type=content_type,
-            charset="utf-8"
+            headers=_OPENMETRICS_HEADERS if openmetrics else _METRICS_HEADERS,
         )
+
+        # Exposition text compresses well; aiohttp picks the coding from
+        # Accept-Encoding and leaves the body as-is for clients that accept none
+        response.enable_compression()
+
+        return response
     except Exception as e:
         logger.error(f"Error generating metrics: {e}")
         return web.Response(
@@ -67,7 +77,7 @@ def create_metrics_app() -> web.Application:
 
 
 class MetricsServer:
-    """Metrics HTTP server manager."""
+    """Metrics HTTP server manager (runs on the caller's event loop)."""
 
     def __init__(self, host: str = "0.0.0.0", port: int = 9090):
         """
@@ -81,84 +91,77 @@ class MetricsServer:
         self.port = port
         self.runner: Optional[web.AppRunner] = None
         self.site: Optional[web.TCPSite] = None
-        self._thread: Optional[threading.Thread] = None
-        self._loop: Optional[asyncio.AbstractEventLoop] = None
-        self._stop_event: Optional[threading.Event] = None
+        self._start_task: Optional[asyncio.Task] = None
 
-    async def _run_server(self) -> None:
-        """Run the metrics server (internal async method)."""
-        try:
-            app = create_metrics_app()
-            self.runner = web.AppRunner(app)
-            await self.runner.setup()
+    async def start_async(self) -> None:
+        """
+        Start the metrics server on the running event loop.
 
-            self.site = web.TCPSite(self.runner, self.host, self.port)
-            await self.site.start()
+        Raises:
+            OSError: If the host/port cannot be bound
+        """
+        if self.site is not None:
+            logger.warning("Metrics server already running")
+            return
 
-            logger.info(f"Metrics server started on http://{self.host}:{self.port}")
-            logger.info(f"  - Metrics: http://{self.host}:{self.port}/metrics")
-            logger.info(f"  - Health:  http://{self.host}:{self.port}/health")
+        # Sample CPU on its own cadence so scrapes only read the latest value
+        start_cpu_sampler()
 
-            # Wait for stop signal
-            if self._stop_event:
-                while not self._stop_event.is_set():
-                    await asyncio.sleep(0.1)
+        app = create_metrics_app()
+        runner = web.AppRunner(app)
+        await runner.setup()
 
-        except Exception as e:
-            logger.error(f"Metrics server error: {e}")
+        try:
+            site = web.TCPSite(runner, self.host, self.port)
+            await site.start()
+        except Exception:
+            await runner.cleanup()
             raise
 
-    def _run_in_thread(self) -> None:
-        """Run server in background thread with its own event loop."""
-        # Create new event loop for this thread
-        self._loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self._loop)
+        self.runner = runner
+        self.site = site
 
-        try:
-            self._loop.run_until_complete(self._run_server())
-        except Exception as e:
-            logger.error(f"Metrics server thread error: {e}")
-        finally:
-            # Cleanup
-            if self._loop and not self._loop.is_closed():
-                self._loop.close()
+        logger.info(f"Metrics server started on http://{self.host}:{self.port}")
+        logger.info(f"  - Metrics: http://{self.host}:{self.port}/metrics")
+        logger.info(f"  - Health:  http://{self.host}:{self.port}/health")
 
     def start(self) -> None:
-        """Start metrics server in background thread."""
-        if self._thread and self._thread.is_alive():
-            logger.warning("Metrics server already running")
-            return
+        """
+        Schedule the metrics server to start on the running event loop.
 
-        self._stop_event = threading.Event()
-        self._thread = threading.Thread(target=self._run_in_thread, daemon=True)
-        self._thread.start()
+        Raises:
+            RuntimeError: If called without a running event loop
+        """
+        if self._start_task and not self._start_task.done():
+            logger.warning("Metrics server already starting")
+            return
 
-        # Give server a moment to start
-        import time
+        self._start_task = asyncio.get_running_loop().create_task(self.start_async())
+        self._start_task.add_done_callback(self._log_start_failure)
 
-        time.sleep(0.5)
+    @staticmethod
+    def _log_start_failure(task: asyncio.Task) -> None:
+        """Log errors from a scheduled start."""
+        if not task.cancelled() and task.exception() is not None:
+            logger.error(f"Metrics server error: {task.exception()}")
 
     async def stop(self) -> None:
         """Stop the metrics server."""
-        if not self._thread or not self._thread.is_alive():
+        # Let a scheduled start finish first so its site is cleaned up too
+        if self._start_task and not self._start_task.done():
+            await asyncio.gather(self._start_task, return_exceptions=True)
+
+        if self.site is None:
             return
 
         logger.info("Stopping metrics server...")
 
-        # Signal thread to stop
-        if self._stop_event:
-            self._stop_event.set()
-
-        # Cleanup aiohttp resources
-        if self.site:
-            await self.site.stop()
-
+        await self.site.stop()
         if self.runner:
             await self.runner.cleanup()
 
-        # Wait for thread to finish (with timeout)
-        if self._thread:
-            self._thread.join(timeout=2.0)
+        self.site = None
+        self.runner = None
 
         logger.info("Metrics server stopped")
 
@@ -169,7 +172,7 @@ class MetricsServer:
         Returns:
             True if server is running
         """
-        return self._thread is not None and self._thread.is_alive()
+        return self.site is not None
 
 
 # Global server instance
@@ -1,8 +1,18 @@
 """Main MCP server implementation using FastMCP."""
 
+import asyncio
+import functools
+import inspect
+import itertools
 import json
 import logging
+import multiprocessing
+import os
+import re
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
 from contextlib import asynccontextmanager
+from pathlib import Path
 from typing import Optional
 
 import httpx
@@ -13,10 +23,10 @@ from youtube_transcript_api import (
     VideoUnavailable,
 )
 
-from .batch.file_batch import process_audio_batch, process_document_batch
+from .batch.file_batch import process_audio_batch, process_document_batch, scan_directory
 from .batch.progress_tracker import ProgressTracker
 from .batch.webpage_batch import process_webpage_batch
-from .batch.youtube_batch import process_youtube_batch
+from .batch.youtube_batch import get_playlist_videos, process_youtube_batch
 from .config import get_config
 from .converters import (
     convert_audio_to_markdown,
@@ -25,14 +35,28 @@ from .converters import (
     convert_webpage_with_selector,
     convert_youtube_to_markdown,
 )
-from .utils import save_markdown_file, validate_output_path
-from .utils.health import ServiceHealth
+from .crawlers import SessionManager, SiteCrawler, site_crawler
+from .utils import (
+    http_client,
+    json_utils,
+    save_markdown_file,
+    save_markdown_files,
+    validate_output_path,
+)
+from .utils.health import (
+    ServiceHealth,
+    get_service_unavailable_error,
+    is_service_healthy,
+    record_service_health,
+)
 from .utils.queue import (
+    QUEUE_NAMES,
     estimate_task_duration,
     format_job_response,
     get_job_info,
     get_queue,
     list_jobs_in_queue,
+    run_in_worker_loop,
     should_queue_task,
 )
 
@@ -48,6 +72,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Characters dropped from titles / replaced in URL paths when building filenames.
+# \w matches the same characters as str.isalnum(), plus "_".
+_UNSAFE_TITLE_CHARS = re.compile(r"[^\w\- ]+")
+_UNSAFE_PATH_CHARS = re.compile(r"[^\w-]")
+
+# Session IDs: alphanumeric characters, hyphens, and underscores
+_SESSION_ID_RE = re.compile(r"[\w-]+")
+
+
+def _safe_filename(title: str) -> str:
+    """Turn a title into a filename stem: unsafe characters dropped, spaces as underscores."""
+    return _UNSAFE_TITLE_CHARS.sub("", title).strip().replace(" ", "_")
+
 
 @asynccontextmanager
 async def lifespan(app: FastMCP):  # type: ignore
@@ -59,13 +96,13 @@ async def lifespan(app: FastMCP):  # type: ignore
     # Startup
     logger.info("Starting Gobbler MCP server...")
     config = get_config()
-    logger.info(f"Configuration loaded from {config.config_path}")
+    logger.info("Configuration loaded from %s", config.config_path)
 
     # Setup structured logging based on config
     log_format = config.get("monitoring.log_format", "text")
     log_level = config.get("monitoring.log_level", "INFO")
     setup_logging(level=log_level, format=log_format)
-    logger.info(f"Logging configured: format={log_format}, level={log_level}")
+    logger.info("Logging configured: format=%s, level=%s", log_format, log_level)
 
     # Start metrics server if enabled
     metrics_enabled = config.get("monitoring.metrics_enabled", False)
@@ -73,10 +110,10 @@ async def lifespan(app: FastMCP):  # type: ignore
     if metrics_enabled:
         try:
             metrics_server = get_metrics_server()
-            metrics_server.start()
+            await metrics_server.start_async()
             logger.info("Metrics collection enabled")
         except Exception as e:
-            logger.warning(f"Failed to start metrics server: {e}")
+            logger.warning("Failed to start metrics server: %s", e)
             logger.warning("Continuing without metrics...")
 
     # Enable config hot-reload if configured
@@ -85,7 +122,7 @@ async def lifespan(app: FastMCP):  # type: ignore
         try:
             config.enable_hot_reload()
         except Exception as e:
-            logger.warning(f"Failed to enable config hot-reload: {e}")
+            logger.warning("Failed to enable config hot-reload: %s", e)
             logger.warning("Continuing without hot-reload...")
 
     # Check service health at startup (don't fail if unavailable)
@@ -101,11 +138,12 @@ async def lifespan(app: FastMCP):  # type: ignore
         unavailable = [name for name, status in health_status.items() if not status]
 
         if available:
-            logger.info(f"Available services: {', '.join(available)}")
+            logger.info("Available services: %s", ", ".join(available))
         if unavailable:
             logger.warning(
-                f"Unavailable services: {', '.join(unavailable)}. "
-                "Some tools will not work until services are started."
+                "Unavailable services: %s. "
+                "Some tools will not work until services are started.",
+                ", ".join(unavailable),
             )
 
     # Start HTTP server for browser extension
@@ -118,7 +156,7 @@ async def lifespan(app: FastMCP):  # type: ignore
             http_port = config.get("http_server.port", 8080)
             http_server = await start_http_server(http_host, http_port)
         except Exception as e:
-            logger.warning(f"Failed to start HTTP server: {e}")
+            logger.warning("Failed to start HTTP server: %s", e)
             logger.warning("Browser extension will not work without HTTP server...")
 
     logger.info("Gobbler MCP server started successfully")
@@ -132,6 +170,13 @@ async def lifespan(app: FastMCP):  # type: ignore
     if http_server:
         await http_server.cleanup()
 
+    # Close shared HTTP clients
+    await site_crawler.shutdown()
+    await http_client.shutdown()
+
+    # Stop download worker processes
+    _shutdown_download_executor()
+
     # Disable config hot-reload
     config.disable_hot_reload()
 
@@ -178,25 +223,18 @@ async def transcribe_youtube(
 
         # Handle output
         if output_file:
-            import os
-            from pathlib import Path
-
             output_path = Path(output_file)
 
-            # If output_file is a directory or doesn't have .md extension, use video title
-            if output_path.is_dir() or not output_file.endswith('.md'):
+            # If output_file is a directory or doesn't have .md extension, use video title.
+            # The suffix check runs first so a plain .md file path is never stat'ed.
+            if not output_file.endswith('.md') or output_path.is_dir():
                 # Get title from metadata and sanitize for filename
                 title = metadata.get('title', f"video_{metadata['video_id']}")
                 # Remove invalid filename characters
-                safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-                safe_title = safe_title.replace(' ', '_')
+                safe_title = _safe_filename(title)
 
-                # Construct the full path
-                if output_path.is_dir():
-                    output_file = str(output_path / f"{safe_title}.md")
-                else:
-                    # It's a directory path provided as string
-                    output_file = os.path.join(output_file, f"{safe_title}.md")
+                # Construct the full path (output_file is an existing or new directory)
+                output_file = str(output_path / f"{safe_title}.md")
 
             # Validate output path
             error = validate_output_path(output_file)
@@ -230,11 +268,76 @@ async def transcribe_youtube(
             "Use language='auto' for default."
         )
     except Exception as e:
-        logger.error(f"Unexpected error in transcribe_youtube: {e}", exc_info=True)
+        logger.error("Unexpected error in transcribe_youtube: %s", e, exc_info=True)
         return f"Failed to extract transcript: {str(e)}"
 
 
+def _crawl4ai_tool(failure_message: str):
+    """
+    Turn Crawl4AI and HTTP errors raised by a webpage tool into user-facing messages.
+
+    Args:
+        failure_message: Prefix for the message returned on unexpected errors
+
+    Returns:
+        Decorator for async tools taking ``url`` and ``timeout`` arguments
+    """
+
+    def decorator(fn):
+        signature = inspect.signature(fn)
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            # Fail fast while Crawl4AI is known to be down instead of waiting to connect
+            service_url = get_config().get_service_url("crawl4ai")
+            if not is_service_healthy(service_url):
+                return get_service_unavailable_error("Crawl4AI")
+
+            try:
+                return await fn(*args, **kwargs)
+            except httpx.ConnectError:
+                record_service_health(service_url, False)
+                return get_service_unavailable_error("Crawl4AI")
+            except httpx.TimeoutException:
+                timeout = _bind_arguments(signature, args, kwargs)["timeout"]
+                return (
+                    f"Failed to fetch URL: Connection timeout after {timeout} seconds. "
+                    "The target server may be slow or the URL may be inaccessible. "
+                    "To increase timeout, use the timeout parameter (maximum 120 seconds)."
+                )
+            except httpx.HTTPStatusError as e:
+                url = _bind_arguments(signature, args, kwargs)["url"]
+                status_code = e.response.status_code
+                if status_code == 404:
+                    return f"HTTP 404: Page not found at {url}"
+                elif status_code >= 500:
+                    return f"HTTP {status_code}: Server error at {url}. The target server may be experiencing issues."
+                else:
+                    return f"HTTP {status_code}: Failed to fetch {url}"
+            except RuntimeError as e:
+                error_msg = str(e)
+                if "not yet implemented" in error_msg:
+                    return error_msg
+                # Crawl4AI errors
+                return f"Crawl4AI error: {error_msg}"
+            except Exception as e:
+                logger.error("Unexpected error in %s: %s", fn.__name__, e, exc_info=True)
+                return f"{failure_message}: {str(e)}"
+
+        return wrapper
+
+    return decorator
+
+
+def _bind_arguments(signature: inspect.Signature, args: tuple, kwargs: dict) -> dict:
+    """Map call arguments to parameter names, including defaults."""
+    bound = signature.bind(*args, **kwargs)
+    bound.apply_defaults()
+    return bound.arguments
+
+
 @mcp.tool()
+@_crawl4ai_tool("Failed to convert web page")
 async def fetch_webpage(
     url: str,
     include_images: bool = True,
@@ -258,63 +361,34 @@ async def fetch_webpage(
         Markdown text with YAML frontmatter if output_file not provided,
         or success message with file path if output_file provided
     """
-    try:
-        # Validate timeout
-        if timeout < 5 or timeout > 120:
-            return "Error: timeout must be between 5 and 120 seconds"
-
-        # Convert to markdown
-        markdown, metadata = await convert_webpage_to_markdown(
-            url=url,
-            include_images=include_images,
-            timeout=timeout,
-        )
+    # Validate timeout
+    if timeout < 5 or timeout > 120:
+        return "Error: timeout must be between 5 and 120 seconds"
 
-        # Handle output
-        if output_file:
-            error = validate_output_path(output_file)
-            if error:
-                return f"Error: {error}"
+    # Convert to markdown
+    markdown, metadata = await convert_webpage_to_markdown(
+        url=url,
+        include_images=include_images,
+        timeout=timeout,
+    )
 
-            success = await save_markdown_file(output_file, markdown)
-            if success:
-                return f"Web page saved to: {output_file}"
-            else:
-                return f"Failed to write file: Permission denied for {output_file}"
-        else:
-            return markdown
+    # Handle output
+    if output_file:
+        error = validate_output_path(output_file)
+        if error:
+            return f"Error: {error}"
 
-    except httpx.ConnectError:
-        return (
-            "Crawl4AI service unavailable. The service may not be running. "
-            "Start with: docker-compose up -d crawl4ai"
-        )
-    except httpx.TimeoutException:
-        return (
-            f"Failed to fetch URL: Connection timeout after {timeout} seconds. "
-            "The target server may be slow or the URL may be inaccessible. "
-            "To increase timeout, use the timeout parameter (maximum 120 seconds)."
-        )
-    except httpx.HTTPStatusError as e:
-        status_code = e.response.status_code
-        if status_code == 404:
-            return f"HTTP 404: Page not found at {url}"
-        elif status_code >= 500:
-            return f"HTTP {status_code}: Server error at {url}. The target server may be experiencing issues."
+        success = await save_markdown_file(output_file, markdown)
+        if success:
+            return f"Web page saved to: {output_file}"
         else:
-            return f"HTTP {status_code}: Failed to fetch {url}"
-    except RuntimeError as e:
-        error_msg = str(e)
-        if "not yet implemented" in error_msg:
-            return error_msg
-        # Crawl4AI errors
-        return f"Crawl4AI error: {error_msg}"
-    except Exception as e:
-        logger.error(f"Unexpected error in fetch_webpage: {e}", exc_info=True)
-        return f"Failed to convert web page: {str(e)}"
+            return f"Failed to write file: Permission denied for {output_file}"
+    else:
+        return markdown
 
 
 @mcp.tool()
+@_crawl4ai_tool("Failed to convert web page with selector")
 async def fetch_webpage_with_selector(
     url: str,
     css_selector: Optional[str] = None,
@@ -420,34 +494,6 @@ async def fetch_webpage_with_selector(
     except ValueError as e:
         # Validation errors
         return str(e)
-    except httpx.ConnectError:
-        return (
-            "Crawl4AI service unavailable. The service may not be running. "
-            "Start with: docker-compose up -d crawl4ai"
-        )
-    except httpx.TimeoutException:
-        return (
-            f"Failed to fetch URL: Connection timeout after {timeout} seconds. "
-            "The target server may be slow or the URL may be inaccessible. "
-            "To increase timeout, use the timeout parameter (maximum 120 seconds)."
-        )
-    except httpx.HTTPStatusError as e:
-        status_code = e.response.status_code
-        if status_code == 404:
-            return f"HTTP 404: Page not found at {url}"
-        elif status_code >= 500:
-            return f"HTTP {status_code}: Server error at {url}. The target server may be experiencing issues."
-        else:
-            return f"HTTP {status_code}: Failed to fetch {url}"
-    except RuntimeError as e:
-        error_msg = str(e)
-        if "not yet implemented" in error_msg:
-            return error_msg
-        # Crawl4AI errors
-        return f"Crawl4AI error: {error_msg}"
-    except Exception as e:
-        logger.error(f"Unexpected error in fetch_webpage_with_selector: {e}", exc_info=True)
-        return f"Failed to convert web page with selector: {str(e)}"
 
 
 @mcp.tool()
@@ -504,13 +550,11 @@ async def create_crawl_session(
         )
     """
     try:
-        from .crawlers.session_manager import SessionManager
-
         # Parse JSON inputs
         cookies_list = None
         if cookies:
             try:
-                cookies_list = json.loads(cookies)
+                cookies_list = json_utils.loads(cookies)
                 if not isinstance(cookies_list, list):
                     return "Error: cookies must be a JSON array of cookie objects"
             except json.JSONDecodeError as e:
@@ -519,14 +563,14 @@ async def create_crawl_session(
         local_storage_dict = None
         if local_storage:
             try:
-                local_storage_dict = json.loads(local_storage)
+                local_storage_dict = json_utils.loads(local_storage)
                 if not isinstance(local_storage_dict, dict):
                     return "Error: local_storage must be a JSON object"
             except json.JSONDecodeError as e:
                 return f"Error: Invalid local_storage JSON: {e}"
 
         # Validate session_id
-        if not session_id.replace("-", "").replace("_", "").isalnum():
+        if not _SESSION_ID_RE.fullmatch(session_id):
             return "Error: session_id must contain only alphanumeric characters, hyphens, and underscores"
 
         # Create session
@@ -539,11 +583,12 @@ async def create_crawl_session(
         )
 
         # Format response
-        response_parts = [
-            f"✅ Session '{session_id}' created successfully",
-            f"Storage location: {result['file_path']}",
-            f"Cookies: {result['cookie_count']}",
-        ]
+        header = (
+            f"✅ Session '{session_id}' created successfully\n"
+            f"Storage location: {result['file_path']}\n"
+            f"Cookies: {result['cookie_count']}"
+        )
+        response_parts = [header]
 
         if result["local_storage_keys"]:
             response_parts.append(
@@ -560,7 +605,7 @@ async def create_crawl_session(
         return "\n".join(response_parts)
 
     except Exception as e:
-        logger.error(f"Failed to create session: {e}", exc_info=True)
+        logger.error("Failed to create session: %s", e, exc_info=True)
         return f"Failed to create session: {str(e)}"
 
 
@@ -629,11 +674,10 @@ async def crawl_site(
         )
     """
     try:
-        from .crawlers.site_crawler import SiteCrawler
-
-        # Validate output_dir if provided
+        # Validate output_dir if provided (once; covers every page saved below)
         if output_dir:
-            error = validate_output_path(output_dir + "/dummy.md")  # Validate parent dir
+            output_path = Path(output_dir)  # Normalizes trailing slashes
+            error = validate_output_path(str(output_path / "dummy.md"))  # Validate parent dir
             if error and "must end with .md" not in error:
                 return f"Error: {error}"
 
@@ -654,45 +698,43 @@ async def crawl_site(
 
         # Save pages to output_dir if specified
         if output_dir:
-            import os
-            from pathlib import Path
-
-            output_path = Path(output_dir)
             output_path.mkdir(parents=True, exist_ok=True)
 
+            # Build all filenames up front, then write the pages in one batch
+            files = []
             for i, page in enumerate(pages):
                 # Create safe filename from URL
-                url_path = page["url"].replace("https://", "").replace("http://", "")
-                safe_name = "".join(c if c.isalnum() or c in ("-", "_") else "_" for c in url_path)
-                safe_name = safe_name[:100]  # Limit length
+                url_path = page["url"].removeprefix("https://").removeprefix("http://")
+                safe_name = _UNSAFE_PATH_CHARS.sub("_", url_path[:100])  # Limit length
 
-                file_path = output_path / f"{i:03d}_{safe_name}.md"
-                success = await save_markdown_file(str(file_path), page["markdown"])
+                files.append((str(output_path / f"{i:03d}_{safe_name}.md"), page["markdown"]))
 
+            # Every page goes directly into output_path, created above
+            results = await save_markdown_files(files, create_dirs=False)
+
+            for page, success in zip(pages, results):
                 if not success:
-                    logger.warning(f"Failed to save page: {page['url']}")
+                    logger.warning("Failed to save page: %s", page["url"])
 
         # Format response
         link_graph = summary["link_graph"]
-        response_parts = [
-            f"✅ Crawl complete: {summary['total_pages']} pages crawled",
-            f"Duration: {summary['duration_ms']}ms",
-            f"Max depth reached: {summary['max_depth_reached']}",
-            f"Domains: {', '.join(summary['domains'])}",
-            "",
-            "**Link Graph Summary:**",
-            f"Total nodes: {len(link_graph)}",
-            f"Total edges: {sum(len(links) for links in link_graph.values())}",
-        ]
+        header = (
+            f"✅ Crawl complete: {summary['total_pages']} pages crawled\n"
+            f"Duration: {summary['duration_ms']}ms\n"
+            f"Max depth reached: {summary['max_depth_reached']}\n"
+            f"Domains: {', '.join(summary['domains'])}\n"
+            "\n"
+            "**Link Graph Summary:**\n"
+            f"Total nodes: {len(link_graph)}\n"
+            f"Total edges: {sum(map(len, link_graph.values()))}"
+        )
+        response_parts = [header]
 
         # Show top linked pages
-        page_incoming = {}
-        for source, targets in link_graph.items():
-            for target in targets:
-                page_incoming[target] = page_incoming.get(target, 0) + 1
+        page_incoming = Counter(itertools.chain.from_iterable(link_graph.values()))
 
         if page_incoming:
-            top_pages = sorted(page_incoming.items(), key=lambda x: x[1], reverse=True)[:5]
+            top_pages = page_incoming.most_common(5)
             response_parts.append("\n**Most linked pages:**")
             for url, count in top_pages:
                 # Shorten URL for display
@@ -705,7 +747,7 @@ async def crawl_site(
         return "\n".join(response_parts)
 
     except Exception as e:
-        logger.error(f"Failed to crawl site: {e}", exc_info=True)
+        logger.error("Failed to crawl site: %s", e, exc_info=True)
         return f"Failed to crawl site: {str(e)}"
 
 
@@ -730,6 +772,10 @@ async def convert_document(
         Markdown text with YAML frontmatter if output_file not provided,
         or success message with file path if output_file provided
     """
+    # Fail fast while Docling is known to be down instead of waiting to connect
+    if not is_service_healthy(get_config().get_service_url("docling")):
+        return get_service_unavailable_error("Docling")
+
     try:
         # Convert to markdown
         markdown, metadata = await convert_document_to_markdown(
@@ -760,10 +806,53 @@ async def convert_document(
             return str(e)
         return f"Docling service unavailable. The service may not be running. Start with: docker-compose up -d docling"
     except Exception as e:
-        logger.error(f"Unexpected error in convert_document: {e}", exc_info=True)
+        logger.error("Unexpected error in convert_document: %s", e, exc_info=True)
         return f"Failed to convert document: {str(e)}"
 
 
+# yt-dlp format selectors for download_youtube_video quality options
+_QUALITY_FORMAT = {
+    'best': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
+    '1080p': 'bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080][ext=mp4]/best',
+    '720p': 'bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]/best',
+    '480p': 'bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[height<=480][ext=mp4]/best',
+    '360p': 'bestvideo[height<=360][ext=mp4]+bestaudio[ext=m4a]/best[height<=360][ext=mp4]/best',
+}
+
+
+# Process pool for synchronous YouTube downloads (lazy loaded)
+_download_executor: Optional[ProcessPoolExecutor] = None
+
+
+def _get_download_executor() -> ProcessPoolExecutor:
+    """Get or create the process pool that runs YouTube downloads."""
+    global _download_executor
+    if _download_executor is None:
+        # spawn, not fork: the server process runs background threads
+        # (CPU sampler, config watcher) that are unsafe to fork
+        _download_executor = ProcessPoolExecutor(
+            max_workers=os.cpu_count() or 2,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+    return _download_executor
+
+
+def _shutdown_download_executor() -> None:
+    """Shut down the download process pool, cancelling pending downloads."""
+    global _download_executor
+    if _download_executor is not None:
+        _download_executor.shutdown(wait=False, cancel_futures=True)
+        _download_executor = None
+
+
+@functools.lru_cache(maxsize=1)
+def _yt_dlp():
+    """Import yt_dlp on first use (slow to import, only needed for downloads)."""
+    import yt_dlp
+
+    return yt_dlp
+
+
 def _download_youtube_video_task(
     video_url: str,
     output_dir: str,
@@ -771,8 +860,7 @@ def _download_youtube_video_task(
     format: str = "mp4",
 ) -> str:
     """Internal download function for both sync and queue execution."""
-    import yt_dlp
-    from pathlib import Path
+    yt_dlp = _yt_dlp()
 
     # Validate output directory
     output_path = Path(output_dir)
@@ -782,41 +870,26 @@ def _download_youtube_video_task(
     # Create directory if it doesn't exist
     output_path.mkdir(parents=True, exist_ok=True)
 
-    # Get video info first to get title
-    ydl_opts_info = {
-        'quiet': True,
-        'no_warnings': True,
-    }
-
-    with yt_dlp.YoutubeDL(ydl_opts_info) as ydl:
-        info = ydl.extract_info(video_url, download=False)
-        title = info.get('title', 'video')
-        # Sanitize title for filename
-        safe_title = "".join(c for c in title if c.isalnum() or c in (' ', '-', '_')).strip()
-        safe_title = safe_title.replace(' ', '_')
-
     # Configure download options
-    quality_format = {
-        'best': 'bestvideo[ext=mp4]+bestaudio[ext=m4a]/best[ext=mp4]/best',
-        '1080p': 'bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080][ext=mp4]/best',
-        '720p': 'bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720][ext=mp4]/best',
-        '480p': 'bestvideo[height<=480][ext=mp4]+bestaudio[ext=m4a]/best[height<=480][ext=mp4]/best',
-        '360p': 'bestvideo[height<=360][ext=mp4]+bestaudio[ext=m4a]/best[height<=360][ext=mp4]/best',
-    }
-
-    selected_format = quality_format.get(quality, quality_format['best'])
+    selected_format = _QUALITY_FORMAT.get(quality, _QUALITY_FORMAT['best'])
 
     ydl_opts = {
         'format': selected_format,
-        'outtmpl': str(output_path / f'{safe_title}.%(ext)s'),
         'merge_output_format': format,
         'quiet': False,
         'no_warnings': False,
     }
 
-    # Download video
     with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-        ydl.download([video_url])
+        # Get video info first to get title
+        info = ydl.extract_info(video_url, download=False)
+        title = info.get('title', 'video')
+        # Sanitize title for filename
+        safe_title = _safe_filename(title)
+
+        # Download video from the extracted info (no second metadata fetch)
+        ydl.params['outtmpl']['default'] = str(output_path / f'{safe_title}.%(ext)s')
+        ydl.process_ie_result(info, download=True)
 
     # Find the downloaded file
     output_file = output_path / f'{safe_title}.{format}'
@@ -867,12 +940,19 @@ async def download_youtube_video(
             )
             return format_job_response(job, "download_youtube", quality=quality)
 
-        # Execute synchronously (run in thread to avoid blocking)
-        import asyncio
-        return await asyncio.to_thread(_download_youtube_video_task, video_url, output_dir, quality, format)
+        # Execute synchronously (in a worker process, so yt-dlp's parsing
+        # doesn't hold the server's GIL or block the event loop)
+        return await asyncio.get_running_loop().run_in_executor(
+            _get_download_executor(),
+            _download_youtube_video_task,
+            video_url,
+            output_dir,
+            quality,
+            format,
+        )
 
     except Exception as e:
-        logger.error(f"Unexpected error in download_youtube_video: {e}", exc_info=True)
+        logger.error("Unexpected error in download_youtube_video: %s", e, exc_info=True)
         return f"Failed to download video: {str(e)}"
 
 
@@ -933,9 +1013,6 @@ async def transcribe_audio(
         If queued: Returns job_id and estimated completion time.
     """
     try:
-        import os
-        from pathlib import Path
-
         # Validate file exists first
         if not Path(file_path).exists():
             return f"Error: File not found: {file_path}"
@@ -967,7 +1044,7 @@ async def transcribe_audio(
         # Transcription errors
         return str(e)
     except Exception as e:
-        logger.error(f"Unexpected error in transcribe_audio: {e}", exc_info=True)
+        logger.error("Unexpected error in transcribe_audio: %s", e, exc_info=True)
         return f"Failed to transcribe audio: {str(e)}"
 
 
@@ -1021,7 +1098,7 @@ async def get_job_status(job_id: str) -> str:
         return "\n".join(result)
 
     except Exception as e:
-        logger.error(f"Error getting job status: {e}", exc_info=True)
+        logger.error("Error getting job status: %s", e, exc_info=True)
         return f"Failed to get job status: {str(e)}"
 
 
@@ -1034,13 +1111,16 @@ async def list_jobs(queue_name: str = "default", limit: int = 20) -> str:
     Useful for monitoring background tasks.
 
     Args:
-        queue_name: Queue to list jobs from (default: 'default', options: 'transcription', 'download')
+        queue_name: Queue to list jobs from (default: 'default', options: 'playlist', 'transcription', 'download')
         limit: Maximum number of jobs to return (default: 20, max: 100)
 
     Returns:
         List of jobs with status, ID, and created time
     """
     try:
+        if queue_name not in QUEUE_NAMES:
+            return f"Unknown queue '{queue_name}'. Valid queues: {', '.join(QUEUE_NAMES)}"
+
         if limit > 100:
             limit = 100
 
@@ -1072,7 +1152,7 @@ async def list_jobs(queue_name: str = "default", limit: int = 20) -> str:
         return "\n".join(result)
 
     except Exception as e:
-        logger.error(f"Error listing jobs: {e}", exc_info=True)
+        logger.error("Error listing jobs: %s", e, exc_info=True)
         return f"Failed to list jobs: {str(e)}"
 
 
@@ -1090,12 +1170,12 @@ def _batch_transcribe_youtube_playlist_task(
     delay_between_requests: float = 1.5,
     jitter_range: float = 1.0,
     max_retries: int = 3,
+    videos: Optional[list] = None,
 ) -> str:
     """Internal task for batch YouTube playlist processing with rate limiting."""
-    import asyncio
 
     # Run async batch processing with rate limiting
-    summary = asyncio.run(
+    summary = run_in_worker_loop(
         process_youtube_batch(
             playlist_url=playlist_url,
             output_dir=output_dir,
@@ -1107,10 +1187,11 @@ def _batch_transcribe_youtube_playlist_task(
             delay_between_requests=delay_between_requests,
             jitter_range=jitter_range,
             max_retries=max_retries,
+            videos=videos,
         )
     )
 
-    return summary.format_report()
+    return summary.save_report()
 
 
 @mcp.tool()
@@ -1157,16 +1238,12 @@ async def batch_transcribe_youtube_playlist(
         - Lower concurrency (1-2) is safer than higher values
     """
     try:
-        from pathlib import Path
-
         # Validate output directory
         output_path = Path(output_dir)
         if not output_path.is_absolute():
             return f"Error: output_dir must be an absolute path. Got: {output_dir}"
 
         # Get video count for queueing decision
-        from .batch.youtube_batch import get_playlist_videos
-
         try:
             videos = await get_playlist_videos(playlist_url, max_videos)
             video_count = len(videos)
@@ -1175,7 +1252,7 @@ async def batch_transcribe_youtube_playlist(
 
         # Check if should queue (>10 videos and auto_queue enabled)
         if auto_queue and video_count > 10:
-            queue = get_queue("default")
+            queue = get_queue("playlist")
             job = queue.enqueue(
                 _batch_transcribe_youtube_playlist_task,
                 playlist_url=playlist_url,
@@ -1188,6 +1265,7 @@ async def batch_transcribe_youtube_playlist(
                 delay_between_requests=delay_between_requests,
                 jitter_range=jitter_range,
                 max_retries=max_retries,
+                videos=videos,  # Already fetched; the worker doesn't fetch the playlist again
                 job_timeout="2h",
             )
 
@@ -1208,7 +1286,7 @@ async def batch_transcribe_youtube_playlist(
                 f"Rate limiting: {delay_between_requests}s + {jitter_range}s jitter, concurrency={concurrency}\n"
                 f"Estimated completion: ~{estimated_minutes} minutes ({int(total_seconds / 60 / 60)}h {estimated_minutes % 60}m)\n\n"
                 f"Check status with: get_job_status(job_id=\"{job.id}\")\n"
-                f"Or list all jobs with: list_jobs()\n\n"
+                f"Or list all jobs with: list_jobs(queue_name=\"playlist\")\n\n"
                 f"💡 Tip: You can continue working while this runs in the background!"
             )
 
@@ -1224,6 +1302,7 @@ async def batch_transcribe_youtube_playlist(
             delay_between_requests=delay_between_requests,
             jitter_range=jitter_range,
             max_retries=max_retries,
+            videos=videos,
         )
 
         return summary.format_report()
@@ -1231,7 +1310,7 @@ async def batch_transcribe_youtube_playlist(
     except ValueError as e:
         return str(e)
     except Exception as e:
-        logger.error(f"Unexpected error in batch_transcribe_youtube_playlist: {e}", exc_info=True)
+        logger.error("Unexpected error in batch_transcribe_youtube_playlist: %s", e, exc_info=True)
         return f"Failed to process playlist: {str(e)}"
 
 
@@ -1244,9 +1323,8 @@ def _batch_fetch_webpages_task(
     skip_existing: bool = True,
 ) -> str:
     """Internal task for batch webpage processing."""
-    import asyncio
 
-    summary = asyncio.run(
+    summary = run_in_worker_loop(
         process_webpage_batch(
             urls=urls,
             output_dir=output_dir,
@@ -1257,7 +1335,7 @@ def _batch_fetch_webpages_task(
         )
     )
 
-    return summary.format_report()
+    return summary.save_report()
 
 
 @mcp.tool()
@@ -1290,8 +1368,6 @@ async def batch_fetch_webpages(
         Batch summary report with statistics and file list
     """
     try:
-        from pathlib import Path
-
         # Validate parameters
         if not urls:
             return "Error: urls list cannot be empty"
@@ -1348,10 +1424,15 @@ async def batch_fetch_webpages(
         return summary.format_report()
 
     except Exception as e:
-        logger.error(f"Unexpected error in batch_fetch_webpages: {e}", exc_info=True)
+        logger.error("Unexpected error in batch_fetch_webpages: %s", e, exc_info=True)
         return f"Failed to process webpages: {str(e)}"
 
 
+def _total_size_mb(files: list) -> float:
+    """Total size of the given files in megabytes."""
+    return sum(f.stat().st_size for f in files) / 1024 / 1024
+
+
 def _batch_transcribe_directory_task(
     input_dir: str,
     output_dir: str = None,
@@ -1363,9 +1444,8 @@ def _batch_transcribe_directory_task(
     skip_existing: bool = True,
 ) -> str:
     """Internal task for batch directory transcription."""
-    import asyncio
 
-    summary = asyncio.run(
+    summary = run_in_worker_loop(
         process_audio_batch(
             input_dir=input_dir,
             output_dir=output_dir,
@@ -1378,7 +1458,7 @@ def _batch_transcribe_directory_task(
         )
     )
 
-    return summary.format_report()
+    return summary.save_report()
 
 
 @mcp.tool()
@@ -1415,8 +1495,6 @@ async def batch_transcribe_directory(
         Batch summary report with statistics and file list
     """
     try:
-        from pathlib import Path
-
         # Validate input directory
         input_path = Path(input_dir)
         if not input_path.is_absolute():
@@ -1432,17 +1510,18 @@ async def batch_transcribe_directory(
         if concurrency < 1 or concurrency > 4:
             return "Error: concurrency must be between 1 and 4"
 
-        # Count files for queueing decision
-        from .batch.file_batch import scan_directory
-
+        # Count files for queueing decision (off the event loop; large or
+        # network-mounted directories can take a while to walk)
         try:
-            files = scan_directory(input_dir, pattern, recursive, file_type="audio")
+            files = await asyncio.to_thread(
+                scan_directory, input_dir, pattern, recursive, file_type="audio"
+            )
             file_count = len(files)
         except ValueError as e:
             return str(e)
 
         # Check if should queue (auto-queue for >3 files or files >500MB total)
-        total_size_mb = sum(f.stat().st_size for f in files) / 1024 / 1024
+        total_size_mb = await asyncio.to_thread(_total_size_mb, files)
         should_queue = auto_queue and (file_count > 10 or total_size_mb > 500)
 
         if should_queue:
@@ -1488,7 +1567,7 @@ async def batch_transcribe_directory(
     except ValueError as e:
         return str(e)
     except Exception as e:
-        logger.error(f"Unexpected error in batch_transcribe_directory: {e}", exc_info=True)
+        logger.error("Unexpected error in batch_transcribe_directory: %s", e, exc_info=True)
         return f"Failed to transcribe directory: {str(e)}"
 
 
@@ -1502,9 +1581,8 @@ def _batch_convert_documents_task(
     skip_existing: bool = True,
 ) -> str:
     """Internal task for batch document conversion."""
-    import asyncio
 
-    summary = asyncio.run(
+    summary = run_in_worker_loop(
         process_document_batch(
             input_dir=input_dir,
             output_dir=output_dir,
@@ -1516,7 +1594,7 @@ def _batch_convert_documents_task(
         )
     )
 
-    return summary.format_report()
+    return summary.save_report()
 
 
 @mcp.tool()
@@ -1550,8 +1628,6 @@ async def batch_convert_documents(
         Batch summary report with statistics and file list
     """
     try:
-        from pathlib import Path
-
         # Validate input directory
         input_path = Path(input_dir)
         if not input_path.is_absolute():
@@ -1568,10 +1644,10 @@ async def batch_convert_documents(
             return "Error: concurrency must be between 1 and 5"
 
         # Count files for queueing decision
-        from .batch.file_batch import scan_directory
-
         try:
-            files = scan_directory(input_dir, pattern, recursive, file_type="document")
+            files = await asyncio.to_thread(
+                scan_directory, input_dir, pattern, recursive, file_type="document"
+            )
             file_count = len(files)
         except ValueError as e:
             return str(e)
@@ -1618,7 +1694,7 @@ async def batch_convert_documents(
     except ValueError as e:
         return str(e)
     except Exception as e:
-        logger.error(f"Unexpected error in batch_convert_documents: {e}", exc_info=True)
+        logger.error("Unexpected error in batch_convert_documents: %s", e, exc_info=True)
         return f"Failed to convert documents: {str(e)}"
 
 
@@ -1647,7 +1723,7 @@ async def browser_check_connection() -> str:
                 "3. The extension will auto-connect to the MCP server"
             )
     except Exception as e:
-        logger.error(f"Error checking browser connection: {e}", exc_info=True)
+        logger.error("Error checking browser connection: %s", e, exc_info=True)
         return f"Failed to check browser connection: {str(e)}"
 
 
@@ -1689,7 +1765,7 @@ async def browser_navigate_to_url(url: str, wait_for_load: bool = True) -> str:
     except RuntimeError as e:
         return str(e)
     except Exception as e:
-        logger.error(f"Error navigating browser: {e}", exc_info=True)
+        logger.error("Error navigating browser: %s", e, exc_info=True)
         return f"Failed to navigate browser: {str(e)}"
 
 
@@ -1746,7 +1822,7 @@ async def browser_execute_script(script: str, timeout: int = 30) -> str:
     except RuntimeError as e:
         return str(e)
     except Exception as e:
-        logger.error(f"Error executing script: {e}", exc_info=True)
+        logger.error("Error executing script: %s", e, exc_info=True)
         return f"Failed to execute script: {str(e)}"
 
 
@@ -1789,7 +1865,7 @@ async def browser_extract_current_page(selector: Optional[str] = None) -> str:
     except RuntimeError as e:
         return str(e)
     except Exception as e:
-        logger.error(f"Error extracting page: {e}", exc_info=True)
+        logger.error("Error extracting page: %s", e, exc_info=True)
         return f"Failed to extract page: {str(e)}"
 
 
@@ -1822,5 +1898,5 @@ async def get_batch_progress(batch_id: str) -> str:
         return tracker.format_progress_report(progress)
 
     except Exception as e:
-        logger.error(f"Error getting batch progress: {e}", exc_info=True)
+        logger.error("Error getting batch progress: %s", e, exc_info=True)
         return f"Failed to get batch progress: {str(e)}"
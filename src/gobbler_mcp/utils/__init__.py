@@ -3,6 +3,7 @@
 from .file_handler import (
     get_file_extension,
     save_markdown_file,
+    save_markdown_files,
     validate_input_path,
     validate_output_path,
 )
@@ -15,14 +16,22 @@ from .frontmatter import (
     create_youtube_frontmatter,
     get_iso8601_timestamp,
 )
-from .health import ServiceHealth, get_service_unavailable_error
+from .health import (
+    ServiceHealth,
+    get_service_unavailable_error,
+    is_service_healthy,
+    record_service_health,
+)
 from .http_client import RetryableHTTPClient
 
 __all__ = [
     "ServiceHealth",
     "get_service_unavailable_error",
+    "is_service_healthy",
+    "record_service_health",
     "RetryableHTTPClient",
     "save_markdown_file",
+    "save_markdown_files",
     "validate_output_path",
     "validate_input_path",
     "get_file_extension",
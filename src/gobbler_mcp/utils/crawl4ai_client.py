@@ -0,0 +1,150 @@
+"""Crawl4AI request helpers shared by the webpage converters."""
+
+import asyncio
+import json
+import logging
+from typing import Any, Dict
+
+import httpx
+
+from .http_client import RetryableHTTPClient
+
+logger = logging.getLogger(__name__)
+
+# Content types Crawl4AI uses for streamed (JSON lines) crawl results
+STREAM_CONTENT_TYPES = ("application/x-ndjson", "application/jsonl", "application/json-lines")
+
+# Raw HTML variants in a crawl result; typically several times larger than the markdown
+HTML_RESULT_FIELDS = ("html", "cleaned_html", "fit_html")
+
+
+def _is_stream_response(response: httpx.Response) -> bool:
+    """Check whether the crawl response carries streamed JSON lines."""
+    content_type = response.headers.get("content-type", "")
+    return content_type.startswith(STREAM_CONTENT_TYPES)
+
+
+def _parse_stream_results(body: str) -> Dict[str, Any]:
+    """
+    Extract the first crawl result from a JSON lines response body.
+
+    Args:
+        body: Response body with one JSON object per line
+
+    Returns:
+        First crawl result
+
+    Raises:
+        RuntimeError: If the crawl failed or returned no results
+    """
+    for line in body.splitlines():
+        if not line.strip():
+            continue
+
+        item = json.loads(line)
+
+        # Trailing completion marker, not a result
+        if item.get("status") == "completed":
+            continue
+
+        if item.get("status") == "failed" or item.get("success") is False:
+            error = item.get("error") or item.get("error_message") or "Unknown error"
+            raise RuntimeError(f"Crawl4AI task failed: {error}")
+
+        return item
+
+    raise RuntimeError("Crawl4AI returned no results")
+
+
+async def _poll_task(
+    client: RetryableHTTPClient,
+    service_url: str,
+    task_id: str,
+    headers: Dict[str, str],
+    timeout: int,
+) -> Dict[str, Any]:
+    """Poll a queued Crawl4AI task until it completes."""
+    max_wait = timeout
+    wait_interval = 1  # seconds
+    elapsed = 0
+
+    while elapsed < max_wait:
+        await asyncio.sleep(wait_interval)
+        elapsed += wait_interval
+
+        # Check task status
+        status_response = await client.get(
+            f"{service_url}/task/{task_id}",
+            headers=headers
+        )
+        status_response.raise_for_status()
+        task_status = status_response.json()
+
+        if task_status.get("status") == "completed":
+            results = task_status.get("results")
+            if not results or len(results) == 0:
+                raise RuntimeError("Crawl4AI returned no results")
+            return results[0]
+        elif task_status.get("status") == "failed":
+            error = task_status.get("error", "Unknown error")
+            raise RuntimeError(f"Crawl4AI task failed: {error}")
+
+    raise httpx.TimeoutException(f"Crawl task did not complete within {timeout} seconds")
+
+
+async def run_crawl(
+    client: RetryableHTTPClient,
+    service_url: str,
+    crawl_request: Dict[str, Any],
+    headers: Dict[str, str],
+    timeout: int,
+    keep_html: bool = True,
+) -> Dict[str, Any]:
+    """
+    Submit a crawl request and return the first result.
+
+    With ``stream`` enabled in the crawler config, Crawl4AI answers with JSON
+    lines as soon as the page is crawled instead of waiting for the next status
+    poll. Servers that ignore streaming and return a task_id are polled once
+    per second as before.
+
+    Args:
+        client: Open HTTP client
+        service_url: Crawl4AI base URL
+        crawl_request: Crawl4AI request payload
+        headers: HTTP headers including auth token
+        timeout: Maximum time to wait for the crawl in seconds
+        keep_html: Keep raw HTML fields in the result. Pass False when only the
+            markdown is used so the HTML is released right away.
+
+    Returns:
+        Crawl4AI result dictionary for the requested URL
+
+    Raises:
+        httpx.TimeoutException: Crawl did not complete in time
+        httpx.HTTPStatusError: HTTP error response
+        RuntimeError: Crawl failed or returned no results
+    """
+    response = await client.post(
+        f"{service_url}/crawl",
+        json=crawl_request,
+        headers=headers
+    )
+    response.raise_for_status()
+
+    if _is_stream_response(response):
+        result = _parse_stream_results(response.text)
+    else:
+        # Non-streaming server: fall back to task polling
+        task_id = response.json().get("task_id")
+        if not task_id:
+            raise RuntimeError("No task_id returned from Crawl4AI")
+
+        logger.debug(f"Crawl4AI returned task {task_id}, polling for completion")
+        result = await _poll_task(client, service_url, task_id, headers, timeout)
+
+    if not keep_html:
+        for field in HTML_RESULT_FIELDS:
+            result.pop(field, None)
+
+    return result
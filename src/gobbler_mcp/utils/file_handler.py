@@ -1,13 +1,17 @@
 """File handling utilities for saving converted content."""
 
+import asyncio
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Sequence, Tuple
 
 import aiofiles
 
 logger = logging.getLogger(__name__)
 
+# Max worker threads writing one batch of files (bounds in-flight writes)
+SAVE_BATCH_WORKERS = 4
+
 
 async def save_markdown_file(
     file_path: str,
@@ -48,6 +52,77 @@ async def save_markdown_file(
         return False
 
 
+def _write_markdown_files(
+    files: Sequence[Tuple[str, str]],
+    create_dirs: bool,
+) -> List[bool]:
+    """Write markdown files synchronously, returning per-file success."""
+    results = []
+    created_dirs = set()
+
+    for file_path, content in files:
+        try:
+            path = Path(file_path)
+
+            # Create parent directories if needed (once per directory)
+            if create_dirs and path.parent not in created_dirs:
+                if not path.parent.exists():
+                    path.parent.mkdir(parents=True, exist_ok=True)
+                    logger.info(f"Created directory: {path.parent}")
+                created_dirs.add(path.parent)
+
+            path.write_text(content, encoding="utf-8")
+
+            logger.info(f"Saved markdown to: {file_path}")
+            results.append(True)
+
+        except PermissionError:
+            logger.error(f"Permission denied writing to: {file_path}")
+            results.append(False)
+        except Exception as e:
+            logger.error(f"Failed to write file {file_path}: {e}")
+            results.append(False)
+
+    return results
+
+
+async def save_markdown_files(
+    files: Sequence[Tuple[str, str]],
+    create_dirs: bool = True,
+    max_workers: int = SAVE_BATCH_WORKERS,
+) -> List[bool]:
+    """
+    Save several markdown files using a fixed number of worker threads.
+
+    save_markdown_file hands each open/write/close to the thread pool
+    separately; for many files (e.g. a site crawl) each worker thread writes
+    its share of the batch in one call instead, so at most max_workers writes
+    are in flight regardless of batch size.
+
+    Args:
+        files: (file_path, content) pairs to save
+        create_dirs: Create parent directories if they don't exist
+        max_workers: Maximum number of worker threads
+
+    Returns:
+        Success flag for each file, in the same order as files
+    """
+    if not files:
+        return []
+
+    workers = max(1, min(max_workers, len(files)))
+    shares = await asyncio.gather(*(
+        asyncio.to_thread(_write_markdown_files, files[i::workers], create_dirs)
+        for i in range(workers)
+    ))
+
+    # Interleave the per-worker results back into input order
+    results: List[bool] = [False] * len(files)
+    for i, share in enumerate(shares):
+        results[i::workers] = share
+    return results
+
+
 def validate_output_path(file_path: str) -> Optional[str]:
     """
     Validate output file path.
@@ -1,7 +1,7 @@
 """Utilities for generating YAML frontmatter in markdown files."""
 
 from datetime import datetime, timezone
-from typing import Any, Dict
+from typing import Any, Dict, Optional
 
 
 def create_frontmatter(metadata: Dict[str, Any]) -> str:
@@ -117,6 +117,7 @@ def create_webpage_frontmatter(
     title: str,
     word_count: int,
     conversion_time_ms: int,
+    extra_fields: Optional[Dict[str, Any]] = None,
 ) -> str:
     """
     Create frontmatter for web page conversion.
@@ -126,6 +127,8 @@ def create_webpage_frontmatter(
         title: Page title
         word_count: Number of words in content
         conversion_time_ms: Conversion time in milliseconds
+        extra_fields: Additional fields appended after the standard ones
+            (a key that already exists replaces the standard value)
 
     Returns:
         YAML frontmatter string
@@ -138,6 +141,8 @@ def create_webpage_frontmatter(
         "conversion_time_ms": conversion_time_ms,
         "converted_at": get_iso8601_timestamp(),
     }
+    if extra_fields:
+        metadata.update(extra_fields)
     return create_frontmatter(metadata)
 
 
@@ -1,12 +1,51 @@
 """Health check utilities for containerized services."""
 
+import asyncio
 import logging
-from typing import Dict, Optional
+import time
+from typing import Dict, Optional, Tuple
 
 import httpx
 
 logger = logging.getLogger(__name__)
 
+# How long a recorded health result is trusted before requests try the service again
+HEALTH_CACHE_TTL = 5.0  # seconds
+
+# Last known health by service URL: (checked_at, healthy)
+_health_cache: Dict[str, Tuple[float, bool]] = {}
+
+
+def record_service_health(service_url: str, healthy: bool) -> None:
+    """
+    Record the health of a service, e.g. after a health check or failed connect.
+
+    Args:
+        service_url: Base URL of service
+        healthy: Whether the service responded
+    """
+    _health_cache[service_url] = (time.monotonic(), healthy)
+
+
+def is_service_healthy(service_url: str, ttl: float = HEALTH_CACHE_TTL) -> bool:
+    """
+    Check the recorded health of a service without contacting it.
+
+    Only a recent failure counts as unhealthy. Unknown or stale results are
+    treated as healthy so the next request finds out for itself.
+
+    Args:
+        service_url: Base URL of service
+        ttl: Seconds a recorded result stays valid
+
+    Returns:
+        False if the service was recorded as down within the last ``ttl`` seconds
+    """
+    cached = _health_cache.get(service_url)
+    if cached is None or time.monotonic() - cached[0] >= ttl:
+        return True
+    return cached[1]
+
 
 class ServiceHealth:
     """Service health checker."""
@@ -46,6 +85,7 @@ class ServiceHealth:
             raise RuntimeError("Health checker not initialized. Use as context manager.")
 
         health_url = f"{service_url}/health"
+        is_healthy = False
         try:
             response = await self._client.get(health_url)
             is_healthy = response.status_code == 200
@@ -55,22 +95,21 @@ class ServiceHealth:
                 logger.warning(
                     f"{service_name} service returned status {response.status_code}"
                 )
-            return is_healthy
         except httpx.ConnectError:
             logger.warning(f"{service_name} service is not reachable at {service_url}")
-            return False
         except httpx.TimeoutException:
             logger.warning(f"{service_name} service health check timed out")
-            return False
         except Exception as e:
             logger.error(f"Unexpected error checking {service_name} health: {e}")
-            return False
+
+        record_service_health(service_url, is_healthy)
+        return is_healthy
 
     async def check_all_services(
         self, service_urls: Dict[str, str]
     ) -> Dict[str, bool]:
         """
-        Check health of all services.
+        Check health of all services concurrently.
 
         Args:
             service_urls: Dictionary mapping service names to URLs
@@ -78,10 +117,12 @@ class ServiceHealth:
         Returns:
             Dictionary mapping service names to health status
         """
-        results = {}
-        for service_name, service_url in service_urls.items():
-            results[service_name] = await self.check_service(service_url, service_name)
-        return results
+        # check_service handles its own errors, so one slow or down service
+        # only costs the time of its own check
+        statuses = await asyncio.gather(
+            *(self.check_service(url, name) for name, url in service_urls.items())
+        )
+        return dict(zip(service_urls, statuses))
 
 
 def get_service_unavailable_error(service_name: str) -> str:
@@ -1,5 +1,6 @@
 """HTTP client wrapper with retry logic for service communication."""
 
+import asyncio
 import logging
 from typing import Any, Dict, Optional
 
@@ -7,9 +8,73 @@ import httpx
 
 logger = logging.getLogger(__name__)
 
+# Connection pool limits for the shared client; sized for concurrent tool calls
+# and batch workers hitting the same few local services
+SHARED_CLIENT_LIMITS = httpx.Limits(
+    max_connections=100,
+    max_keepalive_connections=40,
+    keepalive_expiry=30,
+)
+
+# Client shared by all RetryableHTTPClient instances (lazy loaded, tied to the running event loop)
+_shared_client: Optional[httpx.AsyncClient] = None
+_shared_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def close_client_on_loop(
+    client: Optional[httpx.AsyncClient], loop: Optional[asyncio.AbstractEventLoop]
+) -> None:
+    """
+    Schedule closing a client on the event loop that owns it.
+
+    Clients can't be closed from another loop, so this is used when a lazily
+    created client is replaced after the running loop changes. If the owning
+    loop is already closed, the client can't be closed and a warning is logged.
+
+    Args:
+        client: Client to close (ignored if None or already closed)
+        loop: Event loop the client was created on
+    """
+    if client is None or client.is_closed:
+        return
+    if loop is not None and not loop.is_closed():
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop)
+    else:
+        logger.warning("Discarding HTTP client whose event loop is closed")
+
+
+def _get_shared_client() -> httpx.AsyncClient:
+    """Get or create the shared HTTP client for the running event loop."""
+    global _shared_client, _shared_client_loop
+
+    loop = asyncio.get_running_loop()
+    if _shared_client_loop is not loop:
+        # Retire the previous loop's client (and its pooled connections) on that loop
+        close_client_on_loop(_shared_client, _shared_client_loop)
+        _shared_client = None
+        _shared_client_loop = loop
+    if _shared_client is None or _shared_client.is_closed:
+        _shared_client = httpx.AsyncClient(limits=SHARED_CLIENT_LIMITS)
+    return _shared_client
+
+
+async def shutdown() -> None:
+    """Close the shared HTTP client."""
+    global _shared_client, _shared_client_loop
+
+    if _shared_client is not None:
+        await _shared_client.aclose()
+        _shared_client = None
+        _shared_client_loop = None
+
 
 class RetryableHTTPClient:
-    """HTTP client with automatic retry logic."""
+    """
+    HTTP client with automatic retry logic.
+
+    Requests go through a connection pool shared by all instances, so
+    connections to a service are kept alive between calls.
+    """
 
     def __init__(
         self,
@@ -32,13 +97,12 @@ class RetryableHTTPClient:
 
     async def __aenter__(self) -> "RetryableHTTPClient":
         """Enter async context manager."""
-        self._client = httpx.AsyncClient(timeout=self.timeout)
+        self._client = _get_shared_client()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:  # type: ignore
-        """Exit async context manager."""
-        if self._client:
-            await self._client.aclose()
+        """Exit async context manager (the shared client stays open)."""
+        self._client = None
 
     async def post(
         self,
@@ -72,7 +136,7 @@ class RetryableHTTPClient:
         for attempt in range(self.max_retries):
             try:
                 response = await self._client.post(
-                    url, json=json, data=data, files=files, headers=headers
+                    url, json=json, data=data, files=files, headers=headers, timeout=self.timeout
                 )
 
                 # Check if we should retry on this status
@@ -129,7 +193,7 @@ class RetryableHTTPClient:
 
         for attempt in range(self.max_retries):
             try:
-                response = await self._client.get(url, headers=headers)
+                response = await self._client.get(url, headers=headers, timeout=self.timeout)
 
                 # Check if we should retry on this status
                 if response.status_code in self.retry_statuses:
@@ -1,18 +1,75 @@
 """Queue management utilities using Redis and RQ."""
 
+import asyncio
+import atexit
+import functools
 import logging
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Dict, Optional, Tuple, TypeVar
 
 import redis
 from rq import Queue, Worker
-from rq.job import Job
+from rq.job import Job, JobStatus
 
 from ..config import get_config
 
+try:
+    import uvloop
+except ImportError:  # uvloop is optional (pip install gobbler-mcp[fast])
+    uvloop = None
+
 logger = logging.getLogger(__name__)
 
-# Global Redis connection
+T = TypeVar("T")
+
+# Queues the server enqueues to and the worker listens on by default
+QUEUE_NAMES = ("default", "playlist", "transcription", "download")
+
+# Global Redis connections
 _redis_conn: Optional[redis.Redis] = None
+_metrics_redis_conn: Optional[redis.Redis] = None
+
+# Event loop reused by async tasks across jobs in a worker process (lazy loaded)
+_worker_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# get_job_info results, cached briefly so clients polling a job don't hit Redis on
+# every call
+JOB_INFO_CACHE_TTL = 2.0  # seconds
+JOB_INFO_CACHE_SIZE = 1024
+
+# Finished/failed jobs rarely change, so their info (including the possibly large
+# result) is kept longer, up to a smaller number of jobs. It still expires so a job
+# removed from Redis or re-enqueued under the same ID isn't reported from memory
+TERMINAL_JOB_CACHE_TTL = 60.0  # seconds
+TERMINAL_JOB_CACHE_SIZE = 128
+_TERMINAL_STATUSES = frozenset({JobStatus.FINISHED, JobStatus.FAILED})
+
+# job_id -> (cached_at, info), least recently used first
+_job_info_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+# job_id -> (cached_at, info) for finished/failed jobs, least recently used first
+_terminal_job_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+
+# Socket timeout for metrics reads so a hung Redis can't stall a Prometheus scrape
+METRICS_REDIS_TIMEOUT = 0.5  # seconds
+
+
+def _connect_redis(**options: Any) -> redis.Redis:
+    """Create Redis client from config with extra client options."""
+    config = get_config()
+    redis_config = config.data.get("redis", {})
+    host = redis_config.get("host", "localhost")
+    port = redis_config.get("port", 6379)
+    db = redis_config.get("db", 0)
+
+    logger.info(f"Connecting to Redis at {host}:{port}")
+    return redis.Redis(
+        host=host,
+        port=port,
+        db=db,
+        decode_responses=False,  # RQ needs bytes
+        **options,
+    )
 
 
 def get_redis_connection() -> redis.Redis:
@@ -25,29 +82,74 @@ def get_redis_connection() -> redis.Redis:
     global _redis_conn
 
     if _redis_conn is None:
-        config = get_config()
-        redis_config = config.data.get("redis", {})
-        host = redis_config.get("host", "localhost")
-        port = redis_config.get("port", 6379)
-        db = redis_config.get("db", 0)
-
-        logger.info(f"Connecting to Redis at {host}:{port}")
-        _redis_conn = redis.Redis(
-            host=host,
-            port=port,
-            db=db,
-            decode_responses=False,  # RQ needs bytes
-        )
+        _redis_conn = _connect_redis()
 
     return _redis_conn
 
 
+def get_metrics_redis_connection() -> redis.Redis:
+    """
+    Get or create Redis connection for metrics collection.
+
+    Unlike the shared connection used by RQ, reads fail fast (no retries, short
+    socket timeouts) so metrics are left stale instead of blocking a scrape.
+
+    Returns:
+        Redis connection instance
+    """
+    global _metrics_redis_conn
+
+    if _metrics_redis_conn is None:
+        _metrics_redis_conn = _connect_redis(
+            socket_timeout=METRICS_REDIS_TIMEOUT,
+            socket_connect_timeout=METRICS_REDIS_TIMEOUT,
+            retry=None,
+        )
+
+    return _metrics_redis_conn
+
+
+def run_in_worker_loop(coro: Awaitable[T]) -> T:
+    """
+    Run a coroutine to completion from a synchronous queued task.
+
+    Unlike asyncio.run(), the event loop (and its default thread pool) is
+    created once per worker process and reused by every job the worker runs.
+
+    Args:
+        coro: Coroutine to run
+
+    Returns:
+        Result of the coroutine
+    """
+    global _worker_loop
+
+    if _worker_loop is None or _worker_loop.is_closed():
+        _worker_loop = uvloop.new_event_loop() if uvloop is not None else asyncio.new_event_loop()
+        asyncio.set_event_loop(_worker_loop)
+
+    return _worker_loop.run_until_complete(coro)
+
+
+@atexit.register
+def _close_worker_loop() -> None:
+    """Close the worker event loop on process exit."""
+    global _worker_loop
+
+    if _worker_loop is not None and not _worker_loop.is_closed():
+        _worker_loop.run_until_complete(_worker_loop.shutdown_asyncgens())
+        _worker_loop.run_until_complete(_worker_loop.shutdown_default_executor())
+        _worker_loop.close()
+    _worker_loop = None
+
+
+@functools.lru_cache(maxsize=8)
 def get_queue(name: str = "default") -> Queue:
     """
-    Get RQ queue by name.
+    Get RQ queue by name (cached, all queues share the Redis connection).
 
     Args:
-        name: Queue name (default, transcription, download, etc.)
+        name: Queue name (default, playlist, transcription, download, etc.)
 
     Returns:
         RQ Queue instance
@@ -128,28 +230,47 @@ def get_job_info(job_id: str) -> Dict[str, Any]:
     Returns:
         Dictionary with job status and info
     """
+    cached = _terminal_job_cache.get(job_id)
+    if cached is not None:
+        cached_at, info = cached
+        if time.monotonic() - cached_at < TERMINAL_JOB_CACHE_TTL:
+            _terminal_job_cache.move_to_end(job_id)
+            return dict(info)
+        _terminal_job_cache.pop(job_id, None)
+
+    cached = _job_info_cache.get(job_id)
+    if cached is not None:
+        cached_at, info = cached
+        if time.monotonic() - cached_at < JOB_INFO_CACHE_TTL:
+            _job_info_cache.move_to_end(job_id)
+            return dict(info)
+
     try:
         conn = get_redis_connection()
         job = Job.fetch(job_id, connection=conn)
 
+        # Status was loaded by fetch; don't re-read it from Redis for each check
+        status = job.get_status(refresh=False)
+
         info = {
             "job_id": job_id,
-            "status": job.get_status(),
+            "status": status,
             "created_at": job.created_at.isoformat() if job.created_at else None,
             "started_at": job.started_at.isoformat() if job.started_at else None,
             "ended_at": job.ended_at.isoformat() if job.ended_at else None,
         }
 
-        if job.is_finished:
+        if status == JobStatus.FINISHED:
             info["result"] = job.result
-        elif job.is_failed:
+        elif status == JobStatus.FAILED:
             info["error"] = str(job.exc_info)
-        elif job.is_started:
+        elif status == JobStatus.STARTED:
             # Get progress if available
             progress = job.meta.get("progress", 0)
             info["progress"] = progress
 
-        return info
+        _cache_job_info(job_id, info)
+        return dict(info)
 
     except Exception as e:
         logger.error(f"Failed to get job info for {job_id}: {e}")
@@ -160,6 +281,22 @@ def get_job_info(job_id: str) -> Dict[str, Any]:
         }
 
 
+def _cache_job_info(job_id: str, info: Dict[str, Any]) -> None:
+    """Store job info in the matching cache, evicting least recently used entries."""
+    if info["status"] in _TERMINAL_STATUSES:
+        _job_info_cache.pop(job_id, None)
+        _terminal_job_cache[job_id] = (time.monotonic(), info)
+        _terminal_job_cache.move_to_end(job_id)
+        while len(_terminal_job_cache) > TERMINAL_JOB_CACHE_SIZE:
+            _terminal_job_cache.popitem(last=False)
+        return
+
+    _job_info_cache[job_id] = (time.monotonic(), info)
+    _job_info_cache.move_to_end(job_id)
+    while len(_job_info_cache) > JOB_INFO_CACHE_SIZE:
+        _job_info_cache.popitem(last=False)
+
+
 def list_jobs_in_queue(queue_name: str = "default", limit: int = 20) -> list:
     """
     List jobs in a queue.
@@ -175,13 +312,20 @@ def list_jobs_in_queue(queue_name: str = "default", limit: int = 20) -> list:
         queue = get_queue(queue_name)
         jobs = []
 
-        # Get queued jobs
-        for job in queue.jobs[:limit]:
+        # Get queued jobs: only the first `limit` IDs, loaded in one pipelined round trip.
+        # IDs are read from the head of the queue, so their order gives the position.
+        job_ids = queue.get_job_ids(0, limit) if limit > 0 else []
+        fetched = Job.fetch_many(job_ids, connection=queue.connection, serializer=queue.serializer)
+        for position, job in enumerate(fetched, start=1):
+            if job is None:
+                # Expired or deleted since the ID was read
+                continue
             jobs.append({
                 "job_id": job.id,
-                "status": job.get_status(),
+                "status": job.get_status(refresh=False),
                 "created_at": job.created_at.isoformat() if job.created_at else None,
                 "func_name": job.func_name,
+                "queue_position": position,
             })
 
         return jobs
@@ -1,12 +1,15 @@
 """RQ worker for processing queued tasks."""
 
 import logging
-import os
+import multiprocessing
 import sys
+from typing import List
 
 from rq import SimpleWorker
+from rq.worker import DequeueStrategy
 
-from .utils.queue import get_queue, get_redis_connection
+from .config import get_config
+from .utils.queue import QUEUE_NAMES, get_queue, get_redis_connection
 
 logging.basicConfig(
     level=logging.INFO,
@@ -17,13 +20,8 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-def main():
-    """Start RQ worker to process queued tasks."""
-    # Get queue names from command line or use defaults
-    queue_names = sys.argv[1:] if len(sys.argv) > 1 else ["default", "transcription", "download"]
-
-    logger.info(f"Starting Gobbler worker for queues: {', '.join(queue_names)}")
-
+def run_worker(queue_names: List[str]) -> None:
+    """Run a single worker for the given queues until it is stopped."""
     # Get Redis connection
     conn = get_redis_connection()
 
@@ -35,7 +33,43 @@ def main():
     worker = SimpleWorker(queues, connection=conn)
 
     logger.info("Worker started (SimpleWorker - no forking). Waiting for jobs...")
-    worker.work()
+    # Round-robin across queues so a long backlog in one (e.g. a large playlist)
+    # doesn't hold back jobs waiting in the others
+    worker.work(dequeue_strategy=DequeueStrategy.ROUND_ROBIN)
+
+
+def main():
+    """Start RQ worker to process queued tasks."""
+    # Get queue names from command line or use defaults
+    queue_names = sys.argv[1:] if len(sys.argv) > 1 else list(QUEUE_NAMES)
+    processes = max(1, int(get_config().get("queue.worker_processes", 1)))
+
+    logger.info(f"Starting Gobbler worker for queues: {', '.join(queue_names)}")
+
+    if processes == 1:
+        run_worker(queue_names)
+        return
+
+    # Most queued work waits on the network, so several workers keep more jobs
+    # in flight. Each process runs its own SimpleWorker; spawn (not fork) for the
+    # same reason SimpleWorker is used.
+    logger.info(f"Starting {processes} worker processes")
+    context = multiprocessing.get_context("spawn")
+    workers = [
+        context.Process(target=run_worker, args=(queue_names,), name=f"gobbler-worker-{i}")
+        for i in range(processes)
+    ]
+    for process in workers:
+        process.start()
+
+    try:
+        for process in workers:
+            process.join()
+    except KeyboardInterrupt:
+        # Ctrl-C reaches the whole process group; let workers finish their current job
+        logger.info("Waiting for worker processes to stop...")
+        for process in workers:
+            process.join()
 
 
 if __name__ == "__main__":
@@ -46,7 +46,7 @@ def mock_youtube_api(mocker):
 @pytest.fixture
 def mock_yt_dlp(mocker):
     """Mock yt-dlp for video metadata and downloads."""
-    mock_ytdl = mocker.patch("gobbler_mcp.converters.youtube.yt_dlp.YoutubeDL")
+    mock_ytdl = mocker.patch("yt_dlp.YoutubeDL")
     mock_instance = MagicMock()
     mock_instance.extract_info.return_value = {
         "title": "Test Video",
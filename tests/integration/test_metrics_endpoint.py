@@ -36,6 +36,48 @@ async def test_metrics_endpoint_responds(metrics_server):
         assert "text/plain" in response.headers["content-type"]
 
 
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_metrics_endpoint_sends_content_length(metrics_server):
+    """Test that /metrics is sent with Content-Length rather than chunked."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            "http://127.0.0.1:9099/metrics", headers={"Accept-Encoding": "identity"}
+        )
+
+        assert "transfer-encoding" not in response.headers
+        assert int(response.headers["content-length"]) == len(response.content)
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_metrics_endpoint_gzip(metrics_server):
+    """Test that /metrics is gzip-compressed when the client accepts it."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            "http://127.0.0.1:9099/metrics", headers={"Accept-Encoding": "gzip"}
+        )
+
+        assert response.headers["content-encoding"] == "gzip"
+        assert "gobbler_app_info" in response.text
+
+
+@pytest.mark.integration
+@pytest.mark.asyncio
+async def test_metrics_endpoint_openmetrics(metrics_server):
+    """Test that /metrics serves OpenMetrics when the client accepts it."""
+    async with httpx.AsyncClient() as client:
+        response = await client.get(
+            "http://127.0.0.1:9099/metrics",
+            headers={"Accept": "application/openmetrics-text; version=1.0.0"},
+        )
+
+        assert response.headers["content-type"].startswith("application/openmetrics-text")
+        assert "gobbler_app_info" in response.text
+        assert response.text.count("# EOF") == 1
+        assert response.text.endswith("# EOF\n")
+
+
 @pytest.mark.integration
 @pytest.mark.asyncio
 async def test_health_endpoint_responds(metrics_server):
@@ -235,3 +235,24 @@ class TestBatchSummary:
             processing_time_seconds=185.5,
         )
         assert "3m 5s" in summary3.format_report()
+
+    def test_save_report(self, tmp_path):
+        """Test the full report is written to disk and a short message returned."""
+        summary = BatchSummary(
+            batch_id="batch-1",
+            total_items=3,
+            successful=2,
+            failed=1,
+            skipped=0,
+            output_dir=str(tmp_path),
+            processing_time_seconds=12.0,
+            success_details=[{"source": "a"}, {"source": "b"}],
+            failures=[{"source": "c", "error": "Timeout"}],
+        )
+
+        message = summary.save_report()
+
+        report_path = tmp_path / "_report_batch-1.md"
+        assert report_path.read_text(encoding="utf-8") == summary.format_report()
+        assert "2/3 succeeded, 1 failed" in message
+        assert str(report_path) in message
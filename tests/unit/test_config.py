@@ -110,6 +110,19 @@ class TestServiceUrl:
         url = config.get_service_url("crawl4ai")
         assert url == "http://example.com:8080"
 
+    def test_get_service_url_refreshed_on_reload(self, tmp_path):
+        """Test that cached service URLs follow a config reload."""
+        config_file = tmp_path / "config.yml"
+        config_file.write_text("services:\n  crawl4ai:\n    port: 8080\n")
+        config = Config(config_path=config_file)
+
+        assert config.get_service_url("crawl4ai") == "http://localhost:8080"
+
+        config_file.write_text("services:\n  crawl4ai:\n    port: 9090\n")
+        config.reload()
+
+        assert config.get_service_url("crawl4ai") == "http://localhost:9090"
+
 
 class TestDeepMerge:
     """Test deep merging of configuration dictionaries."""
@@ -149,11 +162,11 @@ class TestGlobalConfig:
     """Test global configuration instance."""
 
     @patch("gobbler_mcp.config.Config")
-    def test_get_config_singleton(self, mock_config_class):
+    def test_get_config_singleton(self, mock_config_class, monkeypatch):
         """Test that get_config returns singleton instance."""
-        # Reset global config
+        # Reset global config (restored after the test, even on failure)
         import gobbler_mcp.config as config_module
-        config_module._config = None
+        monkeypatch.setattr(config_module, "_config", None)
 
         mock_instance = MagicMock()
         mock_config_class.return_value = mock_instance
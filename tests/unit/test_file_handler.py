@@ -7,6 +7,7 @@ import aiofiles
 
 from gobbler_mcp.utils.file_handler import (
     save_markdown_file,
+    save_markdown_files,
     validate_output_path,
     validate_input_path,
     get_file_extension,
@@ -163,3 +164,47 @@ class TestSaveMarkdownFile:
         result = await save_markdown_file("/path/to/output.md", "# Test")
 
         assert result is False
+
+
+class TestSaveMarkdownFiles:
+    """Test batch markdown file saving."""
+
+    @pytest.mark.asyncio
+    async def test_save_markdown_files_writes_all(self, tmp_path):
+        """Test that every file is written and reported in order."""
+        files = [
+            (str(tmp_path / "pages" / "001_a.md"), "# A"),
+            (str(tmp_path / "pages" / "002_b.md"), "# B"),
+        ]
+
+        results = await save_markdown_files(files)
+
+        assert results == [True, True]
+        assert (tmp_path / "pages" / "001_a.md").read_text(encoding="utf-8") == "# A"
+        assert (tmp_path / "pages" / "002_b.md").read_text(encoding="utf-8") == "# B"
+
+    @pytest.mark.asyncio
+    async def test_save_markdown_files_reports_failures(self, tmp_path):
+        """Test that a failed write doesn't stop the rest of the batch."""
+        blocker = tmp_path / "blocker"
+        blocker.write_text("not a directory")
+        files = [
+            (str(blocker / "001_a.md"), "# A"),
+            (str(tmp_path / "002_b.md"), "# B"),
+        ]
+
+        results = await save_markdown_files(files)
+
+        assert results == [False, True]
+        assert (tmp_path / "002_b.md").exists()
+
+    @pytest.mark.asyncio
+    async def test_save_markdown_files_keeps_order_across_workers(self, tmp_path):
+        """Test that results line up with the input when split across workers."""
+        files = [(str(tmp_path / f"{i:03d}.md"), f"# {i}") for i in range(7)]
+        files[4] = (str(tmp_path / "missing" / "004.md"), "# 4")
+
+        results = await save_markdown_files(files, create_dirs=False, max_workers=3)
+
+        assert results == [True, True, True, True, False, True, True]
+        assert (tmp_path / "006.md").read_text(encoding="utf-8") == "# 6"
@@ -188,6 +188,25 @@ class TestWebpageFrontmatter:
         assert "conversion_time_ms: 5000" in result
         assert '"2025-10-03T00:00:00Z"' in result  # Timestamps are quoted
 
+    @patch("gobbler_mcp.utils.frontmatter.get_iso8601_timestamp")
+    def test_create_webpage_frontmatter_extra_fields(self, mock_timestamp):
+        """Test extra fields are appended and override standard fields."""
+        mock_timestamp.return_value = "2025-10-03T00:00:00Z"
+
+        result = create_webpage_frontmatter(
+            url="https://example.com/article",
+            title="Test Article",
+            word_count=1200,
+            conversion_time_ms=0,
+            extra_fields={"selector": "article", "source": "browser_extension"},
+        )
+
+        lines = result.split("\n")
+        assert lines[1] == "source: browser_extension"
+        assert lines[-3] == "selector: article"
+        assert lines[-2] == "---"
+        assert result.count("source:") == 1
+
 
 class TestDocumentFrontmatter:
     """Test document-specific frontmatter generation."""
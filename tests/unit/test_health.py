@@ -0,0 +1,77 @@
+"""Unit tests for service health utilities."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from gobbler_mcp.utils import health
+from gobbler_mcp.utils.health import is_service_healthy, record_service_health
+
+SERVICE_URL = "http://localhost:11235"
+
+
+@pytest.fixture(autouse=True)
+def clear_health_cache():
+    """Start each test without recorded health results."""
+    health._health_cache.clear()
+    yield
+    health._health_cache.clear()
+
+
+def test_unknown_service_is_healthy():
+    """Test that a service never checked is assumed healthy."""
+    assert is_service_healthy(SERVICE_URL)
+
+
+def test_recent_failure_is_unhealthy():
+    """Test that a recorded failure is reported within the TTL."""
+    with patch("gobbler_mcp.utils.health.time.monotonic", return_value=100.0):
+        record_service_health(SERVICE_URL, False)
+        assert not is_service_healthy(SERVICE_URL)
+
+
+def test_stale_failure_is_retried():
+    """Test that a failure older than the TTL no longer blocks requests."""
+    with patch("gobbler_mcp.utils.health.time.monotonic", return_value=100.0):
+        record_service_health(SERVICE_URL, False)
+
+    with patch(
+        "gobbler_mcp.utils.health.time.monotonic",
+        return_value=100.0 + health.HEALTH_CACHE_TTL,
+    ):
+        assert is_service_healthy(SERVICE_URL)
+
+
+@pytest.mark.asyncio
+async def test_check_service_records_result():
+    """Test that a failed health check is recorded for later requests."""
+    async with health.ServiceHealth(timeout=0.5) as checker:
+        # Nothing listens on port 9 (discard) locally
+        healthy = await checker.check_service("http://127.0.0.1:9", "Test")
+
+    assert healthy is False
+    assert not is_service_healthy("http://127.0.0.1:9")
+
+
+@pytest.mark.asyncio
+async def test_check_all_services_runs_checks_concurrently():
+    """Test that all services are checked at once and results keep their names."""
+    started = []
+    release = asyncio.Event()
+
+    async def fake_check(service_url, service_name):
+        started.append(service_name)
+        if len(started) == 2:
+            release.set()
+        # Only completes once both checks are in flight
+        await asyncio.wait_for(release.wait(), timeout=1)
+        return service_name == "Docling"
+
+    async with health.ServiceHealth() as checker:
+        with patch.object(checker, "check_service", side_effect=fake_check):
+            results = await checker.check_all_services(
+                {"Crawl4AI": "http://localhost:11235", "Docling": "http://localhost:5001"}
+            )
+
+    assert results == {"Crawl4AI": False, "Docling": True}
@@ -0,0 +1,48 @@
+"""Unit tests for the retrying HTTP client."""
+
+import asyncio
+
+import pytest
+
+from gobbler_mcp.utils import http_client
+from gobbler_mcp.utils.http_client import RetryableHTTPClient
+
+
+async def _get_client():
+    """Get the shared client from inside a running event loop."""
+    return http_client._get_shared_client()
+
+
+@pytest.mark.asyncio
+async def test_clients_share_connection_pool():
+    """Test that clients reuse one underlying httpx client until shutdown."""
+    async with RetryableHTTPClient(timeout=5) as first:
+        shared = first._client
+    async with RetryableHTTPClient(timeout=30) as second:
+        assert second._client is shared
+
+    # Leaving the context doesn't close the shared client
+    assert not shared.is_closed
+
+    await http_client.shutdown()
+    assert shared.is_closed
+
+
+def test_shared_client_closed_when_loop_changes():
+    """Test that the previous loop's shared client is closed on its own loop."""
+    old_loop = asyncio.new_event_loop()
+    try:
+        old_client = old_loop.run_until_complete(_get_client())
+
+        async def replace_client():
+            new_client = await _get_client()
+            await http_client.shutdown()
+            return new_client
+
+        assert asyncio.run(replace_client()) is not old_client
+
+        # The close was scheduled on the old loop; let it run there
+        old_loop.run_until_complete(asyncio.sleep(0.01))
+        assert old_client.is_closed
+    finally:
+        old_loop.close()
@@ -0,0 +1,36 @@
+"""Unit tests for JSON serialization helpers."""
+
+import json
+
+import pytest
+
+from gobbler_mcp.utils import json_utils
+
+
+def test_dumps_returns_bytes():
+    """Test serialization returns UTF-8 bytes."""
+    data = json_utils.dumps({"name": "café", "count": 2})
+
+    assert isinstance(data, bytes)
+    assert json.loads(data) == {"name": "café", "count": 2}
+
+
+def test_dumps_indent():
+    """Test pretty-printed output uses 2-space indentation."""
+    data = json_utils.dumps({"cookies": [1]}, indent=True)
+
+    assert b'\n  "cookies"' in data
+
+
+def test_loads_roundtrip():
+    """Test bytes and str input both deserialize."""
+    payload = {"session_id": "test", "cookies": [{"name": "a", "value": "b"}]}
+
+    assert json_utils.loads(json_utils.dumps(payload)) == payload
+    assert json_utils.loads(json.dumps(payload)) == payload
+
+
+def test_loads_invalid_raises_json_decode_error():
+    """Test invalid JSON raises the stdlib JSONDecodeError type."""
+    with pytest.raises(json.JSONDecodeError):
+        json_utils.loads(b"{not json")
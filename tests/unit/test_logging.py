@@ -99,6 +99,28 @@ def test_structured_formatter_with_extra_fields():
     assert data["duration"] == 1.5
 
 
+def test_structured_formatter_timestamp():
+    """Test timestamps are UTC ISO 8601 and taken from the record."""
+    formatter = StructuredFormatter()
+    record = logging.LogRecord(
+        name="test.logger",
+        level=logging.INFO,
+        pathname="test.py",
+        lineno=42,
+        msg="Test message",
+        args=(),
+        exc_info=None,
+    )
+    record.created = 1759415531.25
+
+    first = json.loads(formatter.format(record))["timestamp"]
+    record.created = 1759415531.5
+    second = json.loads(formatter.format(record))["timestamp"]
+
+    assert first == "2025-10-02T14:32:11.250000+00:00"
+    assert second == "2025-10-02T14:32:11.500000+00:00"
+
+
 def test_setup_logging_text_format():
     """Test text logging setup."""
     logger_name = "test.text.logger"
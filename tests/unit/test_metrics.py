@@ -1,8 +1,12 @@
 """Unit tests for Prometheus metrics."""
 
+from unittest.mock import MagicMock, patch
+
+import fakeredis
 import pytest
 from prometheus_client import REGISTRY
 
+from gobbler_mcp import metrics
 from gobbler_mcp.metrics import (
     conversion_duration,
     conversion_size,
@@ -13,6 +17,15 @@ from gobbler_mcp.metrics import (
 )
 
 
+@pytest.fixture(autouse=True)
+def metrics_config():
+    """Use default monitoring settings regardless of the global config."""
+    config = MagicMock()
+    config.get.side_effect = lambda key, default=None: default
+    with patch("gobbler_mcp.config.get_config", return_value=config):
+        yield config
+
+
 @pytest.fixture
 def clear_metrics():
     """Clear metrics before each test."""
@@ -129,6 +142,30 @@ def test_get_metrics_includes_resource_metrics():
     assert "gobbler_memory_usage_bytes" in metrics_text
 
 
+def test_get_metrics_throttles_dynamic_updates():
+    """Test resource and queue metrics are refreshed at most once per interval."""
+    with patch.object(metrics, "_last_update", None), \
+            patch.object(metrics, "update_resource_metrics") as mock_resources, \
+            patch.object(metrics, "update_queue_metrics") as mock_queues:
+        get_metrics()
+        get_metrics()
+
+    assert mock_resources.call_count == 1
+    assert mock_queues.call_count == 1
+
+
+def test_update_queue_metrics_reads_queue_lengths():
+    """Test queue depths are read from RQ queue keys."""
+    conn = fakeredis.FakeRedis()
+    conn.rpush("rq:queue:transcription", b"job-1", b"job-2")
+
+    with patch("gobbler_mcp.utils.queue.get_metrics_redis_connection", return_value=conn):
+        metrics.update_queue_metrics()
+
+    assert metrics.queue_depth.labels(queue_name="transcription")._value.get() == 2
+    assert metrics.queue_depth.labels(queue_name="default")._value.get() == 0
+
+
 def test_conversion_tracker_context_manager():
     """Test ConversionTracker as context manager."""
     converter_type = "test_context"
@@ -0,0 +1,122 @@
+"""Unit tests for queue utilities."""
+
+from unittest.mock import patch
+
+import fakeredis
+import pytest
+from rq import Queue
+
+from gobbler_mcp.utils import queue as queue_utils
+from gobbler_mcp.utils.queue import get_job_info, list_jobs_in_queue
+
+
+@pytest.fixture
+def redis_conn():
+    """Provide a fake Redis connection used by the queue helpers."""
+    conn = fakeredis.FakeRedis()
+    queue_utils._job_info_cache.clear()
+    queue_utils._terminal_job_cache.clear()
+    queue_utils.get_queue.cache_clear()
+    with patch("gobbler_mcp.utils.queue.get_redis_connection", return_value=conn):
+        yield conn
+    queue_utils.get_queue.cache_clear()
+
+
+def test_list_jobs_in_queue_respects_limit(redis_conn):
+    """Test that only the first `limit` queued jobs are listed, in queue order."""
+    queue = Queue("default", connection=redis_conn)
+    job_ids = [queue.enqueue("builtins.print", i).id for i in range(5)]
+
+    jobs = list_jobs_in_queue("default", limit=3)
+
+    assert [job["job_id"] for job in jobs] == job_ids[:3]
+    assert [job["queue_position"] for job in jobs] == [1, 2, 3]
+    assert all(job["status"] == "queued" for job in jobs)
+    assert jobs[0]["func_name"] == "builtins.print"
+
+
+def test_list_jobs_in_queue_zero_limit(redis_conn):
+    """Test that a zero limit lists no jobs."""
+    Queue("default", connection=redis_conn).enqueue("builtins.print", 1)
+
+    assert list_jobs_in_queue("default", limit=0) == []
+
+
+def test_get_job_info_queued_job(redis_conn):
+    """Test job info for a queued job."""
+    job = Queue("default", connection=redis_conn).enqueue("builtins.print", 1)
+
+    info = get_job_info(job.id)
+
+    assert info["job_id"] == job.id
+    assert info["status"] == "queued"
+    assert info["created_at"] is not None
+
+
+def test_get_job_info_missing_job(redis_conn):
+    """Test job info for an unknown job ID."""
+    info = get_job_info("missing-job")
+
+    assert info["status"] == "not_found"
+
+
+def test_get_job_info_cached_between_polls(redis_conn):
+    """Test that polling within the TTL is served without reading Redis."""
+    job = Queue("default", connection=redis_conn).enqueue("builtins.print", 1)
+    get_job_info(job.id)
+
+    with patch("gobbler_mcp.utils.queue.Job.fetch") as mock_fetch:
+        info = get_job_info(job.id)
+
+    mock_fetch.assert_not_called()
+    assert info["status"] == "queued"
+
+
+def test_get_job_info_refreshed_after_ttl(redis_conn):
+    """Test that a cached non-terminal status is re-read once the TTL passes."""
+    job = Queue("default", connection=redis_conn).enqueue("builtins.print", 1)
+    with patch("gobbler_mcp.utils.queue.time.monotonic", return_value=100.0):
+        get_job_info(job.id)
+
+    job.set_status("started")
+    with patch(
+        "gobbler_mcp.utils.queue.time.monotonic",
+        return_value=100.0 + queue_utils.JOB_INFO_CACHE_TTL,
+    ):
+        info = get_job_info(job.id)
+
+    assert info["status"] == "started"
+
+
+def test_get_job_info_finished_job_served_from_memory(redis_conn):
+    """Test that a finished job's info outlives the short TTL for active jobs."""
+    job = Queue("default", connection=redis_conn).enqueue("builtins.print", 1)
+    job.set_status("finished")
+    with patch("gobbler_mcp.utils.queue.time.monotonic", return_value=100.0):
+        get_job_info(job.id)
+
+    with patch(
+        "gobbler_mcp.utils.queue.time.monotonic",
+        return_value=100.0 + queue_utils.TERMINAL_JOB_CACHE_TTL - 1,
+    ), patch("gobbler_mcp.utils.queue.Job.fetch") as mock_fetch:
+        info = get_job_info(job.id)
+
+    mock_fetch.assert_not_called()
+    assert info["status"] == "finished"
+
+
+def test_get_job_info_finished_job_expires(redis_conn):
+    """Test that a finished job is re-read from Redis once its TTL passes."""
+    job = Queue("default", connection=redis_conn).enqueue("builtins.print", 1)
+    job.set_status("finished")
+    with patch("gobbler_mcp.utils.queue.time.monotonic", return_value=100.0):
+        get_job_info(job.id)
+
+    job.delete()
+    with patch(
+        "gobbler_mcp.utils.queue.time.monotonic",
+        return_value=100.0 + queue_utils.TERMINAL_JOB_CACHE_TTL,
+    ):
+        info = get_job_info(job.id)
+
+    assert info["status"] == "not_found"
@@ -1,5 +1,7 @@
 """Unit tests for webpage selector converter."""
 
+import json
+
 import pytest
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -14,6 +16,7 @@ def setup_mock_client(client_instance, task_response):
     """Helper to setup mock client with proper async responses."""
     # Mock crawl submission - client.post() is async and returns a response
     post_response = MagicMock()
+    post_response.headers = {"content-type": "application/json"}
     post_response.json.return_value = {"task_id": "test-task-123"}
     post_response.raise_for_status = MagicMock()
     client_instance.post = AsyncMock(return_value=post_response)
@@ -66,6 +69,45 @@ async def test_convert_webpage_with_xpath(mock_crawl4ai_response):
         assert metadata["xpath"] == "//article[@class='main']"
 
 
+@pytest.mark.asyncio
+async def test_convert_webpage_with_streamed_result(mock_crawl4ai_response):
+    """Test streamed (JSON lines) crawl results are used without polling."""
+    with patch("gobbler_mcp.converters.webpage_selector.RetryableHTTPClient") as mock_client:
+        client_instance = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = client_instance
+
+        post_response = MagicMock()
+        post_response.headers = {"content-type": "application/x-ndjson"}
+        post_response.text = (
+            json.dumps(mock_crawl4ai_response) + "\n" + json.dumps({"status": "completed"}) + "\n"
+        )
+        client_instance.post = AsyncMock(return_value=post_response)
+        client_instance.get = AsyncMock()
+
+        markdown, metadata = await convert_webpage_with_selector(url="https://example.com")
+
+        assert "Test Article" in markdown
+        client_instance.get.assert_not_called()
+        crawl_request = client_instance.post.call_args[1]["json"]
+        assert crawl_request["crawler_config"]["params"]["stream"] is True
+
+
+@pytest.mark.asyncio
+async def test_convert_webpage_with_streamed_failure():
+    """Test a failed streamed crawl result raises RuntimeError."""
+    with patch("gobbler_mcp.converters.webpage_selector.RetryableHTTPClient") as mock_client:
+        client_instance = AsyncMock()
+        mock_client.return_value.__aenter__.return_value = client_instance
+
+        post_response = MagicMock()
+        post_response.headers = {"content-type": "application/x-ndjson"}
+        post_response.text = json.dumps({"success": False, "error_message": "blocked"}) + "\n"
+        client_instance.post = AsyncMock(return_value=post_response)
+
+        with pytest.raises(RuntimeError, match="blocked"):
+            await convert_webpage_with_selector(url="https://example.com")
+
+
 @pytest.mark.asyncio
 async def test_convert_webpage_with_both_selectors_raises_error():
     """Test that providing both CSS and XPath selectors raises ValueError."""
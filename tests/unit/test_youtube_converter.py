@@ -78,7 +78,7 @@ class TestTimestampFormatting:
 class TestVideoMetadata:
     """Test video metadata extraction using yt-dlp."""
 
-    @patch("gobbler_mcp.converters.youtube.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     def test_get_video_metadata_success(self, mock_ytdl):
         """Test successful metadata extraction."""
         mock_instance = MagicMock()
@@ -98,7 +98,7 @@ class TestVideoMetadata:
         assert result["thumbnail"] == "https://example.com/thumb.jpg"
         assert result["description"] == "Test description"
 
-    @patch("gobbler_mcp.converters.youtube.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     def test_get_video_metadata_uses_uploader_fallback(self, mock_ytdl):
         """Test that uploader is used when channel is not available."""
         mock_instance = MagicMock()
@@ -114,7 +114,7 @@ class TestVideoMetadata:
 
         assert result["channel"] == "Test Uploader"
 
-    @patch("gobbler_mcp.converters.youtube.yt_dlp.YoutubeDL")
+    @patch("yt_dlp.YoutubeDL")
     def test_get_video_metadata_failure_returns_none(self, mock_ytdl):
         """Test that metadata extraction failure returns None values."""
         mock_instance = MagicMock()